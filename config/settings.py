@@ -1,3 +1,4 @@
+import functools
 import os
 import streamlit as st
 from dotenv import load_dotenv
@@ -39,7 +40,11 @@ class Config:
     # Google Sheets API Configuration (for multi-sheet access)
     USE_GOOGLE_SHEETS_API = get_env_var('USE_GOOGLE_SHEETS_API', 'false').lower() == 'true'
     GOOGLE_SHEETS_CREDENTIALS_FILE = get_env_var('GOOGLE_SHEETS_CREDENTIALS_FILE', 'credentials/google-sheets-service-account.json')
-    
+
+    # Manager mapping published as static JSON ({"mapping": {...}, "emails": {...}})
+    # When set, it is fetched instead of the Google Sheets CSV export
+    MANAGER_MAPPING_JSON_URL = get_env_var('MANAGER_MAPPING_JSON_URL')
+
     # Email Configuration
     SMTP_HOST = get_env_var('SMTP_HOST', 'smtp.gmail.com')
     SMTP_PORT = int(get_env_var('SMTP_PORT', '587'))
@@ -143,6 +148,16 @@ class Config:
     API_REQUEST_TIMEOUT = int(get_env_var('API_REQUEST_TIMEOUT', '30'))
     MAX_RETRY_ATTEMPTS = int(get_env_var('MAX_RETRY_ATTEMPTS', '3'))
     BATCH_SIZE = int(get_env_var('BATCH_SIZE', '10'))
+    # Seconds a fetched TeamLogger summary report is reused for the same date range
+    TEAMLOGGER_REPORT_CACHE_TTL = int(get_env_var('TEAMLOGGER_REPORT_CACHE_TTL', '30'))
+    # Last-resort hour extraction that sums every numeric field of a report item
+    TEAMLOGGER_FALLBACK_SUM = get_env_var('TEAMLOGGER_FALLBACK_SUM', 'false').lower() == 'true'
+    # Employees processed concurrently by the hours monitoring workflow
+    WORKFLOW_PARALLELISM = int(get_env_var('WORKFLOW_PARALLELISM', '16'))
+    # Seconds computed leave counts, active employee lists and week records are reused between workflow views
+    LEAVE_CACHE_TTL = int(get_env_var('LEAVE_CACHE_TTL', '300'))
+    # Seconds a downloaded leave sheet (CSV export) is reused before it is fetched again
+    SHEETS_CACHE_TTL = int(get_env_var('SHEETS_CACHE_TTL', '300'))
 
     @classmethod
     def validate(cls) -> tuple[bool, list]:
@@ -258,8 +273,9 @@ class Config:
         return status_info['alert_needed'], status_info
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_config_summary(cls) -> dict:
-        """Get configuration summary"""
+        """Get configuration summary (built once per process - the settings are fixed at import, don't mutate the result)"""
         return {
             'app_name': cls.APP_NAME,
             'app_version': cls.APP_VERSION,
@@ -320,8 +336,9 @@ class Config:
                 return f"{full_days}.5 days ({full_days} full + 1 half)"
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_ai_status(cls) -> dict:
-        """Get AI enhancement status"""
+        """Get AI enhancement status (built once per process - the settings are fixed at import, don't mutate the result)"""
         return {
             'enabled': cls.ENABLE_OPENAI_ENHANCEMENT and bool(cls.OPENAI_API_KEY),
             'api_key_configured': bool(cls.OPENAI_API_KEY),
@@ -149,8 +149,7 @@ def preview_hours_alerts():
 
     with st.spinner("🔍 Analyzing employee hours with real-time data..."):
         # Clear cache to force fresh detection
-        if hasattr(workflow, '_cached_company_holidays'):
-            delattr(workflow, '_cached_company_holidays')
+        workflow.clear_caches()
 
         employees_needing_alerts = workflow.get_employees_needing_real_alerts()
 
@@ -4,7 +4,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from jinja2 import Template
 import logging
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple
 from config.settings import Config
 from datetime import datetime
 import os
@@ -99,72 +99,14 @@ class EmailService:
         Uses your existing low_hours_email.html template
         """
         try:
-            # Validate real employee data
-            if not self._validate_real_employee_data(real_employee_data):
-                logger.warning(f"Invalid employee data for {real_employee_data.get('email', 'unknown')}")
-                return False
-        
-            # Check if email credentials are properly configured
-            if not self._is_email_configured():
-                logger.warning(f"Email not sent to {real_employee_data['email']} - Email credentials not configured")
-                self._print_real_email_preview(real_employee_data)
-                return False
-        
-            # Calculate shortfall in minutes (1 hour = 60 minutes)
-            shortfall_hours = real_employee_data.get('shortfall', 0)
-            shortfall_minutes = int(shortfall_hours * 60)
-        
-            # Skip if shortfall is less than 10 minutes
-            if shortfall_minutes < 10:
-                logger.info(f"Skipping alert for {real_employee_data['name']} - negligible shortfall: {shortfall_minutes} minutes")
-                return True
-        
-            # Create email content using your template
-            subject = self._create_real_email_subject(real_employee_data)
-            html_body = self._create_email_body_from_template(real_employee_data)
-        
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.from_email
-            msg['To'] = real_employee_data['email']
-        
-            # Get manager email for CC
-            from src.manager_mapping import get_manager_email
-            cc_emails = list(self.cc_emails)  # Start with general CC emails (includes teamhr)
-        
-            manager_email = get_manager_email(real_employee_data['name'])
-            if manager_email and manager_email not in cc_emails:
-                cc_emails.append(manager_email)
-                logger.info(f"Adding manager {manager_email} to CC for {real_employee_data['name']}")
-            
-            # Ensure teamhr@rapidinnovation.dev is always in CC
-            if Config.CONSTANT_CC_EMAIL not in cc_emails:
-                cc_emails.append(Config.CONSTANT_CC_EMAIL)
-            
-            logger.info(f"CC list for {real_employee_data['name']}: {', '.join(cc_emails)}")
-        
-            # Add CC emails if configured
-            if cc_emails:
-                msg['Cc'] = ', '.join(cc_emails)
-        
-            # Attach HTML content
-            html_part = MIMEText(html_body, 'html')
-            msg.attach(html_part)
-        
+            prepared = self._prepare_low_hours_alert(real_employee_data)
+            if isinstance(prepared, bool):
+                return prepared
+            msg, recipients, manager_email = prepared
+
             # Send email with retry logic
-            recipients = [real_employee_data['email']] + cc_emails
             success = self._send_email_with_retry(msg, real_employee_data, recipients)
-        
-            if success:
-                self.emails_sent += 1
-                logger.info(f"Low hours alert sent to {real_employee_data['name']} ({real_employee_data['email']})")
-                if manager_email:
-                    logger.info(f"  CC'd to manager: {manager_email}")
-                logger.info(f"  CC'd to teamhr: {Config.CONSTANT_CC_EMAIL}")
-            else:
-                self.emails_failed += 1
-            
+            self._record_low_hours_result(real_employee_data, success, manager_email)
             return success
         
         except Exception as e:
@@ -172,6 +114,162 @@ class EmailService:
             logger.error(f"Error sending email to {real_employee_data.get('email', 'unknown')}: {str(e)}")
             self._print_real_email_preview(real_employee_data)
             return False
+
+    def send_low_hours_alerts_bulk(self, alerts: List[Dict]) -> List[bool]:
+        """
+        Send several low hours alerts over one SMTP session instead of one login per email
+        Returns a success flag per alert, in the same order
+        """
+        results = [False] * len(alerts)
+        outgoing = []
+        for index, real_employee_data in enumerate(alerts):
+            try:
+                prepared = self._prepare_low_hours_alert(real_employee_data)
+                if isinstance(prepared, bool):
+                    results[index] = prepared
+                else:
+                    outgoing.append((index, real_employee_data) + prepared)
+            except Exception as e:
+                self.emails_failed += 1
+                logger.error(f"Error sending email to {real_employee_data.get('email', 'unknown')}: {str(e)}")
+                self._print_real_email_preview(real_employee_data)
+
+        if not outgoing:
+            return results
+
+        def record(position: int, success: bool, error: Optional[Exception] = None) -> None:
+            index, real_employee_data, _, _, manager_email = outgoing[position]
+            if error is not None:
+                logger.error(f"Error sending email to {real_employee_data['email']}: {str(error)}")
+            self._record_low_hours_result(real_employee_data, success, manager_email)
+
+        def send_individually(position: int) -> bool:
+            # Per-email retry path for whatever the shared session could not deliver
+            index, real_employee_data, msg, recipients, manager_email = outgoing[position]
+            success = self._send_email_with_retry(msg, real_employee_data, recipients)
+            self._record_low_hours_result(real_employee_data, success, manager_email)
+            return success
+
+        sent = self._send_messages_bulk([(msg, recipients) for _, _, msg, recipients, _ in outgoing],
+                                        record, send_individually)
+        for (index, *_), success in zip(outgoing, sent):
+            results[index] = success
+        return results
+
+    def _send_messages_bulk(self, messages: List[Tuple[MIMEMultipart, List[str]]],
+                            record: Callable[..., None], send_individually: Callable[[int], bool]) -> List[bool]:
+        """
+        Send prepared (msg, recipients) pairs over one SMTP session
+        record(position, success, error) is called for each message the session handled;
+        send_individually(position) sends and records anything left after the session fails.
+        Authentication failures are recorded without retrying. Returns a success flag per message
+        """
+        results = [False] * len(messages)
+        delivered = 0
+        try:
+            if self._test_smtp_connectivity():
+                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
+                    server.starttls()
+                    server.login(self.smtp_username, self.smtp_password)
+                    for position, (msg, recipients) in enumerate(messages):
+                        try:
+                            server.send_message(msg, from_addr=self.from_email, to_addrs=recipients)
+                            results[position] = True
+                            record(position, True)
+                        except smtplib.SMTPServerDisconnected:
+                            raise
+                        except smtplib.SMTPException as e:
+                            # Refused recipient or message - the session itself is still usable
+                            record(position, False, e)
+                        delivered += 1
+            else:
+                logger.warning("SMTP connectivity issue, sending emails individually")
+
+        except smtplib.SMTPAuthenticationError as e:
+            logger.error(f"Email authentication failed: {str(e)}")
+            for position in range(delivered, len(messages)):
+                record(position, False, e)
+            return results  # Don't retry auth failures
+
+        except Exception as e:
+            logger.warning(f"Shared SMTP session failed, sending remaining emails individually: {str(e)}")
+
+        for position in range(delivered, len(messages)):
+            results[position] = send_individually(position)
+        return results
+
+    def _prepare_low_hours_alert(self, real_employee_data: Dict):
+        """
+        Validate the employee data and build the low hours alert message
+        Returns (msg, recipients, manager_email), or a bool when nothing needs sending:
+        False for invalid data or missing credentials, True for a negligible shortfall
+        """
+        # Validate real employee data
+        if not self._validate_real_employee_data(real_employee_data):
+            logger.warning(f"Invalid employee data for {real_employee_data.get('email', 'unknown')}")
+            return False
+    
+        # Check if email credentials are properly configured
+        if not self._is_email_configured():
+            logger.warning(f"Email not sent to {real_employee_data['email']} - Email credentials not configured")
+            self._print_real_email_preview(real_employee_data)
+            return False
+    
+        # Calculate shortfall in minutes (1 hour = 60 minutes)
+        shortfall_hours = real_employee_data.get('shortfall', 0)
+        shortfall_minutes = int(shortfall_hours * 60)
+    
+        # Skip if shortfall is less than 10 minutes
+        if shortfall_minutes < 10:
+            logger.info(f"Skipping alert for {real_employee_data['name']} - negligible shortfall: {shortfall_minutes} minutes")
+            return True
+    
+        # Create email content using your template
+        subject = self._create_real_email_subject(real_employee_data)
+        html_body = self._create_email_body_from_template(real_employee_data)
+    
+        # Create message
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = self.from_email
+        msg['To'] = real_employee_data['email']
+    
+        # Get manager email for CC
+        from src.manager_mapping import get_manager_email
+        cc_emails = list(self.cc_emails)  # Start with general CC emails (includes teamhr)
+    
+        manager_email = get_manager_email(real_employee_data['name'])
+        if manager_email and manager_email not in cc_emails:
+            cc_emails.append(manager_email)
+            logger.info(f"Adding manager {manager_email} to CC for {real_employee_data['name']}")
+        
+        # Ensure teamhr@rapidinnovation.dev is always in CC
+        if Config.CONSTANT_CC_EMAIL not in cc_emails:
+            cc_emails.append(Config.CONSTANT_CC_EMAIL)
+        
+        logger.info(f"CC list for {real_employee_data['name']}: {', '.join(cc_emails)}")
+    
+        # Add CC emails if configured
+        if cc_emails:
+            msg['Cc'] = ', '.join(cc_emails)
+    
+        # Attach HTML content
+        html_part = MIMEText(html_body, 'html')
+        msg.attach(html_part)
+    
+        recipients = [real_employee_data['email']] + cc_emails
+        return msg, recipients, manager_email
+
+    def _record_low_hours_result(self, real_employee_data: Dict, success: bool, manager_email) -> None:
+        """Update sending statistics and log the outcome of one low hours alert"""
+        if success:
+            self.emails_sent += 1
+            logger.info(f"Low hours alert sent to {real_employee_data['name']} ({real_employee_data['email']})")
+            if manager_email:
+                logger.info(f"  CC'd to manager: {manager_email}")
+            logger.info(f"  CC'd to teamhr: {Config.CONSTANT_CC_EMAIL}")
+        else:
+            self.emails_failed += 1
     
     def _validate_real_employee_data(self, data: Dict) -> bool:
         """
@@ -461,52 +559,92 @@ class EmailService:
             bool: True if email sent successfully, False otherwise
         """
         try:
-            employee_name = employee_data.get('name', 'Employee')
-            employee_email = employee_data.get('email', '')
-            manager_email = employee_data.get('manager_email', '')
-
-            if not employee_email:
-                logger.error(f"No email address for {employee_name}")
+            prepared = self._prepare_activity_alert(employee_data)
+            if prepared is None:
                 return False
+            msg, recipients = prepared
 
-            # Create email message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"Activity Level Reminder - {employee_name}"
-            msg['From'] = self.from_email
-            msg['To'] = employee_email
+            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
+                server.starttls()
+                server.login(self.smtp_username, self.smtp_password)
+                server.send_message(msg, from_addr=self.from_email, to_addrs=recipients)
 
-            # Add manager and HR to CC
-            cc_emails = list(self.cc_emails)
-            if manager_email and manager_email != "Not Available":
-                cc_emails.append(manager_email)
+            self._record_activity_result(employee_data, True)
+            return True
 
-            if cc_emails:
-                msg['Cc'] = ', '.join(cc_emails)
+        except Exception as e:
+            self._record_activity_result(employee_data, False, e)
+            return False
 
-            # Create HTML email body
-            html_body = self._create_activity_alert_html(employee_data)
-            html_part = MIMEText(html_body, 'html')
-            msg.attach(html_part)
+    def send_low_activity_alerts_bulk(self, alerts: List[Dict]) -> List[bool]:
+        """
+        Send several activity alerts over one SMTP session instead of one login per email
+        Returns a success flag per alert, in the same order
+        """
+        results = [False] * len(alerts)
+        outgoing = []
+        for index, employee_data in enumerate(alerts):
+            try:
+                prepared = self._prepare_activity_alert(employee_data)
+                if prepared is not None:
+                    outgoing.append((index, employee_data) + prepared)
+            except Exception as e:
+                self._record_activity_result(employee_data, False, e)
 
-            # Send email
-            recipients = [employee_email] + cc_emails
+        if not outgoing:
+            return results
 
-            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg, from_addr=self.from_email, to_addrs=recipients)
+        def record(position: int, success: bool, error: Optional[Exception] = None) -> None:
+            self._record_activity_result(outgoing[position][1], success, error)
 
+        sent = self._send_messages_bulk([(msg, recipients) for _, _, msg, recipients in outgoing],
+                                        record, lambda position: self.send_low_activity_alert(outgoing[position][1]))
+        for (index, *_), success in zip(outgoing, sent):
+            results[index] = success
+        return results
+
+    def _prepare_activity_alert(self, employee_data: Dict):
+        """Build the activity alert message, returns (msg, recipients) or None when there is no address"""
+        employee_name = employee_data.get('name', 'Employee')
+        employee_email = employee_data.get('email', '')
+        manager_email = employee_data.get('manager_email', '')
+
+        if not employee_email:
+            logger.error(f"No email address for {employee_name}")
+            return None
+
+        # Create email message
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = f"Activity Level Reminder - {employee_name}"
+        msg['From'] = self.from_email
+        msg['To'] = employee_email
+
+        # Add manager and HR to CC
+        cc_emails = list(self.cc_emails)
+        if manager_email and manager_email != "Not Available":
+            cc_emails.append(manager_email)
+
+        if cc_emails:
+            msg['Cc'] = ', '.join(cc_emails)
+
+        # Create HTML email body
+        html_body = self._create_activity_alert_html(employee_data)
+        html_part = MIMEText(html_body, 'html')
+        msg.attach(html_part)
+
+        return msg, [employee_email] + cc_emails
+
+    def _record_activity_result(self, employee_data: Dict, success: bool, error: Exception = None):
+        """Update counters and log the outcome of one activity alert"""
+        if success:
             self.emails_sent += 1
-            logger.info(f"📧 Activity alert sent to {employee_name} ({employee_email})")
+            manager_email = employee_data.get('manager_email', '')
+            logger.info(f"📧 Activity alert sent to {employee_data.get('name', 'Employee')} ({employee_data.get('email', '')})")
             if manager_email and manager_email != "Not Available":
                 logger.info(f"📧 CC'd to manager: {manager_email}")
-
-            return True
-
-        except Exception as e:
+        else:
             self.emails_failed += 1
-            logger.error(f"Failed to send activity alert to {employee_data.get('name', 'Unknown')}: {str(e)}")
-            return False
+            logger.error(f"Failed to send activity alert to {employee_data.get('name', 'Unknown')}: {str(error)}")
 
     def _create_activity_alert_html(self, employee_data: Dict) -> str:
         """Create HTML content for activity alert email"""
@@ -7,16 +7,23 @@ import csv
 from io import StringIO
 import urllib.parse
 import re
+import threading
 import time
 import random
 
 logger = logging.getLogger(__name__)
 
+# One HTTP session per thread, shared by every client instance so concurrent workflow
+# workers never share a connection and new clients reuse already-open ones
+_thread_sessions = threading.local()
+
 class GoogleSheetsLeaveClient:
     def __init__(self):
         self.spreadsheet_id = self._extract_spreadsheet_id(Config.GOOGLE_SHEETS_ID)
         self.gid = self._extract_gid_from_url()
-        self._session = requests.Session()
+        # Sheet name -> (fetched_at, rows); concurrent workers share one download per sheet
+        self._sheet_cache: Dict[str, Tuple[float, List[List[str]]]] = {}
+        self._lock = threading.Lock()
 
         # GID mapping for different month sheets
         # Format: "Month YY" -> GID
@@ -34,6 +41,14 @@ class GoogleSheetsLeaveClient:
         if self.gid:
             logger.info(f"Default GID: {self.gid}")
     
+    def _get_session(self) -> requests.Session:
+        """Return the HTTP session for the calling thread, creating it on first use"""
+        session = getattr(_thread_sessions, 'session', None)
+        if session is None:
+            session = requests.Session()
+            _thread_sessions.session = session
+        return session
+
     def _extract_spreadsheet_id(self, id_or_url: str) -> str:
         """Extract spreadsheet ID from either ID or full URL"""
         if '/' in id_or_url:
@@ -128,6 +143,31 @@ class GoogleSheetsLeaveClient:
         return is_valid
 
     def _fetch_sheet_data(self, sheet_name: str, force_refresh: bool = True) -> List[List[str]]:
+        """Fetch sheet data, reusing a copy downloaded within SHEETS_CACHE_TTL unless force_refresh"""
+        if not force_refresh:
+            cached = self._sheet_cache.get(sheet_name)
+            if cached and time.monotonic() - cached[0] < Config.SHEETS_CACHE_TTL:
+                logger.debug(f"📦 Using cached data for '{sheet_name}'")
+                return cached[1]
+
+        with self._lock:
+            # Another thread may have fetched this sheet while we waited
+            cached = self._sheet_cache.get(sheet_name)
+            if not force_refresh and cached and time.monotonic() - cached[0] < Config.SHEETS_CACHE_TTL:
+                return cached[1]
+
+            data = self._download_sheet_data(sheet_name)
+            # Failed fetches are not cached so the next call retries
+            if data:
+                self._sheet_cache[sheet_name] = (time.monotonic(), data)
+            return data
+
+    def clear_cache(self):
+        """Clear the sheet data cache"""
+        self._sheet_cache = {}
+        logger.info("🗑️ Sheet cache cleared")
+
+    def _download_sheet_data(self, sheet_name: str) -> List[List[str]]:
         """Fetch sheet data - try multiple approaches"""
         logger.info(f"Fetching real-time data for sheet '{sheet_name}'")
         
@@ -146,10 +186,8 @@ class GoogleSheetsLeaveClient:
             'User-Agent': f'EmployeeMonitor/{Config.APP_VERSION}'
         }
         
-        # Close existing session
-        self._session.close()
-        self._session = requests.Session()
-        
+        session = self._get_session()
+
         # ENHANCED: Try multiple strategies with validation for maximum column coverage
 
         # Strategy 1: Published CSV URL with ultra-wide range (most reliable)
@@ -165,7 +203,7 @@ class GoogleSheetsLeaveClient:
 
                     logger.debug(f"Trying published CSV with range {range_spec}: {test_url[:100]}...")
 
-                    response = self._session.get(test_url, timeout=30, headers=headers)
+                    response = session.get(test_url, timeout=30, headers=headers)
                     if response.status_code == 200:
                         content = response.text
                         csv_data = StringIO(content)
@@ -195,7 +233,7 @@ class GoogleSheetsLeaveClient:
 
                     logger.debug(f"Trying GID export {range_spec or 'no-range'}: {url[:100]}...")
 
-                    response = self._session.get(url, timeout=30, headers=headers)
+                    response = session.get(url, timeout=30, headers=headers)
                     if response.status_code == 200:
                         content = response.text
                         csv_data = StringIO(content)
@@ -224,7 +262,7 @@ class GoogleSheetsLeaveClient:
                         continue
                         
                     logger.debug(f"Trying URL: {url}")
-                    response = self._session.get(url, timeout=30, headers=headers)
+                    response = session.get(url, timeout=30, headers=headers)
                     
                     if response.status_code == 200:
                         content = response.text
@@ -256,21 +294,7 @@ class GoogleSheetsLeaveClient:
                 if month_key not in processed_months:
                     processed_months.add(month_key)
                     
-                    # Try different sheet name formats - PRIORITIZE "Sep 25" format
-                    sheet_names = [
-                        current_date.strftime("%b %y"),      # Sep 25 (PRIORITY - has actual leave data)
-                        current_date.strftime("%B %y"),      # September 25
-                        current_date.strftime("%B %Y"),      # September 2025
-                        current_date.strftime("%B_%y"),      # September_25
-                        current_date.strftime("%B-%y"),      # September-25
-                    ]
-                    
-                    sheet_data = []
-                    for sheet_name in sheet_names:
-                        sheet_data = self._fetch_sheet_data(sheet_name, force_refresh=True)
-                        if sheet_data:
-                            logger.info(f"Found data with sheet name: {sheet_name}")
-                            break
+                    sheet_data = self._fetch_month_sheet(current_date, force_refresh)
                     
                     if sheet_data and len(sheet_data) > 1:
                         leaves = self._extract_leaves_with_half_days(
@@ -294,6 +318,62 @@ class GoogleSheetsLeaveClient:
             logger.error(f"Error fetching leaves for {employee_name}: {str(e)}")
             return []
     
+    def get_employee_leaves_bulk(self, employee_names: List[str], start_date: datetime,
+                                 end_date: datetime) -> Dict[str, List[Dict]]:
+        """Get leave records for many employees, fetching each month's sheet only once"""
+        try:
+            leaves_by_employee = {name: [] for name in employee_names}
+            processed_months = set()
+
+            current_date = start_date
+            while current_date <= end_date:
+                month_key = (current_date.year, current_date.month)
+
+                if month_key not in processed_months:
+                    processed_months.add(month_key)
+                    sheet_data = self._fetch_month_sheet(current_date)
+
+                    if sheet_data and len(sheet_data) > 1:
+                        for name in employee_names:
+                            leaves_by_employee[name].extend(self._extract_leaves_with_half_days(
+                                sheet_data,
+                                name,
+                                current_date.year,
+                                current_date.month,
+                                start_date,
+                                end_date
+                            ))
+                    else:
+                        logger.warning(f"No data found for {current_date.strftime('%B %Y')}")
+
+                current_date += timedelta(days=1)
+
+            logger.info(f"Fetched leaves for {len(employee_names)} employees in bulk")
+            return leaves_by_employee
+
+        except Exception as e:
+            logger.error(f"Error fetching bulk leaves: {str(e)}")
+            return {}
+
+    def _fetch_month_sheet(self, month_date: datetime, force_refresh: bool = False) -> List[List[str]]:
+        """Fetch the leave sheet for a month, trying the known sheet name formats"""
+        # Try different sheet name formats - PRIORITIZE "Sep 25" format
+        sheet_names = [
+            month_date.strftime("%b %y"),      # Sep 25 (PRIORITY - has actual leave data)
+            month_date.strftime("%B %y"),      # September 25
+            month_date.strftime("%B %Y"),      # September 2025
+            month_date.strftime("%B_%y"),      # September_25
+            month_date.strftime("%B-%y"),      # September-25
+        ]
+
+        sheet_data = []
+        for sheet_name in sheet_names:
+            sheet_data = self._fetch_sheet_data(sheet_name, force_refresh=force_refresh)
+            if sheet_data:
+                logger.info(f"Found data with sheet name: {sheet_name}")
+                break
+        return sheet_data
+
     def _extract_leaves_with_half_days(self, sheet_data: List[List[str]], employee_name: str, 
                                      year: int, month: int, start_date: datetime, end_date: datetime) -> List[Dict]:
         """Extract leave data with improved matching"""
@@ -4,6 +4,7 @@ This is the recommended approach for multi-month leave tracking
 """
 
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional
 from config.settings import Config
@@ -18,6 +19,7 @@ class GoogleSheetsAPIClient:
         self.spreadsheet_id = self._extract_spreadsheet_id(Config.GOOGLE_SHEETS_ID)
         self.service = None
         self._sheet_cache = {}  # Cache to avoid hitting rate limits
+        self._lock = threading.Lock()  # The googleapiclient service is not thread-safe
         self._initialize_api()
         
     def _extract_spreadsheet_id(self, id_or_url: str) -> str:
@@ -69,8 +71,8 @@ class GoogleSheetsAPIClient:
                 )
                 logger.info("✅ Loaded credentials from file")
 
-            # Build the service
-            self.service = build('sheets', 'v4', credentials=credentials)
+            # Build the service from the bundled discovery document, skipping the discovery cache lookup
+            self.service = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
             logger.info("✅ Google Sheets API initialized successfully")
 
         except ImportError:
@@ -105,10 +107,15 @@ class GoogleSheetsAPIClient:
             # Use A:BZ range to get all columns (up to 78 columns)
             range_name = f"'{sheet_name}'!A:BZ"
 
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
+            with self._lock:
+                # Another thread may have fetched this sheet while we waited
+                if use_cache and sheet_name in self._sheet_cache:
+                    return self._sheet_cache[sheet_name]
+
+                result = self.service.spreadsheets().values().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=range_name
+                ).execute()
 
             values = result.get('values', [])
 
@@ -140,6 +147,57 @@ class GoogleSheetsAPIClient:
         """Check if the Google Sheets API is available and initialized"""
         return self.service is not None
     
+    def _months_in_range(self, start_date: datetime, end_date: datetime) -> List[str]:
+        """Sheet tab names (e.g. "Oct 25") for every month touched by the date range"""
+        months = []
+        current_date = start_date
+
+        while current_date <= end_date:
+            months.append(current_date.strftime("%b %y"))
+
+            # Move to next month
+            if current_date.month == 12:
+                current_date = current_date.replace(year=current_date.year + 1, month=1, day=1)
+            else:
+                current_date = current_date.replace(month=current_date.month + 1, day=1)
+
+        return months
+
+    def get_employee_leaves_bulk(self, employee_names: List[str], start_date: datetime,
+                                 end_date: datetime) -> Dict[str, List[Dict]]:
+        """
+        Get leave records for many employees at once
+
+        All month tabs that are not cached yet are fetched with a single
+        values.batchGet request; each employee is then parsed from the cache.
+        """
+        if not self.service:
+            logger.error("Google Sheets API not initialized")
+            return {}
+
+        missing = [m for m in self._months_in_range(start_date, end_date) if m not in self._sheet_cache]
+        if missing:
+            try:
+                with self._lock:
+                    result = self.service.spreadsheets().values().batchGet(
+                        spreadsheetId=self.spreadsheet_id,
+                        ranges=[f"'{month_name}'!A:BZ" for month_name in missing]
+                    ).execute()
+
+                for month_name, value_range in zip(missing, result.get('valueRanges', [])):
+                    values = value_range.get('values', [])
+                    if values:
+                        self._sheet_cache[month_name] = values
+                logger.info(f"✅ Fetched {len(missing)} sheet(s) in one batch request - cached")
+            except Exception as e:
+                # e.g. a month tab that doesn't exist yet fails the whole batch
+                logger.warning(f"Batch fetch failed, falling back to per-sheet requests: {e}")
+
+        return {
+            name: self.get_employee_leaves(name, start_date, end_date)
+            for name in employee_names
+        }
+
     def get_employee_leaves(self, employee_name: str, start_date: datetime,
                           end_date: datetime, force_refresh: bool = True) -> List[Dict]:
         """
@@ -155,22 +213,8 @@ class GoogleSheetsAPIClient:
         """
         leaves = []
         
-        # Determine which months to check
-        current_date = start_date
-        months_to_check = set()
-        
-        while current_date <= end_date:
-            month_name = current_date.strftime("%b %y")  # e.g., "Oct 25"
-            months_to_check.add(month_name)
-            
-            # Move to next month
-            if current_date.month == 12:
-                current_date = current_date.replace(year=current_date.year + 1, month=1, day=1)
-            else:
-                current_date = current_date.replace(month=current_date.month + 1, day=1)
-        
         # Check each month
-        for month_name in months_to_check:
+        for month_name in self._months_in_range(start_date, end_date):
             sheet_data = self.get_sheet_data(month_name)
             
             if not sheet_data or len(sheet_data) < 2:
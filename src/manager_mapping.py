@@ -7,12 +7,25 @@ Now reads from Google Sheets in real-time to ensure accuracy
 import logging
 import requests
 import csv
+import bisect
+import functools
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from io import StringIO
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Optional: rapidfuzz gives a fast C++ fuzzy fallback for misspelled names
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = None
+    fuzz_process = None
+
 class DynamicManagerMapping:
     """Dynamic manager mapping that reads from Google Sheets in real-time"""
 
@@ -20,23 +33,65 @@ class DynamicManagerMapping:
         # Manager mapping Google Sheet URL
         self.manager_sheet_url = "https://docs.google.com/spreadsheets/d/1hqj2whB7bH0aoDeNV-ORIl_5dXX0eHcglhabW9xeVt8/edit?usp=sharing"
         self.spreadsheet_id = "1hqj2whB7bH0aoDeNV-ORIl_5dXX0eHcglhabW9xeVt8"
+        # Optional edge-cached JSON copy of the sheet (avoids Sheets rate limits)
+        self.json_url = Config.MANAGER_MAPPING_JSON_URL
+        # Created on first fetch so importing this module stays cheap
+        self._session = None
         self._cached_mapping = {}
         self._cache_timestamp = None
+        # Bumped whenever _cached_mapping is replaced; keys the lookup caches
+        self._cache_version = 0
+
+    def _get_session(self) -> requests.Session:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    def _fetch_manager_mapping_from_json(self) -> Dict[str, str]:
+        """Fetch the manager mapping from the published JSON file"""
+        try:
+            logger.info("Fetching manager mapping from published JSON...")
+            response = self._get_session().get(self.json_url, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+
+            mapping = {sys.intern(str(k).strip()): sys.intern(str(v).strip())
+                       for k, v in data.get('mapping', {}).items() if k and v}
+            manager_emails = {sys.intern(str(k).strip()): str(v).strip()
+                              for k, v in data.get('emails', {}).items() if v and '@' in str(v)}
+
+            global MANAGER_EMAILS
+            MANAGER_EMAILS.update(manager_emails)
+
+            logger.info(f"Successfully loaded {len(mapping)} manager mappings from JSON")
+            return mapping
+
+        except Exception as e:
+            logger.warning(f"Error fetching manager mapping JSON, falling back to Google Sheets: {str(e)}")
+            return {}
 
     def _fetch_manager_mapping_from_sheets(self) -> Dict[str, str]:
         """Fetch the latest manager mapping from Google Sheets"""
+        if self.json_url:
+            mapping = self._fetch_manager_mapping_from_json()
+            if mapping:
+                return mapping
+
         try:
             # Convert Google Sheets URL to CSV export URL
             csv_url = f"https://docs.google.com/spreadsheets/d/{self.spreadsheet_id}/export?format=csv"
 
+            # Ask for a compressed body. Pragma: no-cache is only the HTTP/1.0 form of
+            # Cache-Control: no-cache, so sending it as well adds nothing
             headers = {
-                'Cache-Control': 'no-cache, no-store, must-revalidate',
-                'Pragma': 'no-cache',
-                'Expires': '0'
+                'Accept-Encoding': 'gzip',
+                'Cache-Control': 'no-cache',
+                'User-Agent': f'EmployeeMonitor/{Config.APP_VERSION}'
             }
 
             logger.info("Fetching manager mapping from Google Sheets...")
-            response = requests.get(csv_url, timeout=30, headers=headers)
+            response = self._get_session().get(csv_url, timeout=30, headers=headers)
 
             if response.status_code == 200:
                 content = response.text
@@ -49,8 +104,9 @@ class DynamicManagerMapping:
 
                 for row in reader:
                     if len(row) >= 3 and row[0].strip() and row[2].strip():
-                        employee_name = row[0].strip()
-                        manager_name = row[2].strip()  # Column C (Manager Name), not Column B (Employee Email)
+                        # Intern names: each manager name repeats across many rows
+                        employee_name = sys.intern(row[0].strip())
+                        manager_name = sys.intern(row[2].strip())  # Column C (Manager Name), not Column B (Employee Email)
                         mapping[employee_name] = manager_name
 
                         # Also capture manager email if available (column D)
@@ -79,8 +135,6 @@ class DynamicManagerMapping:
 
     def get_current_mapping(self, force_refresh: bool = False) -> Dict[str, str]:
         """Get current manager mapping with optional caching"""
-        from datetime import datetime, timedelta
-
         # Check if we need to refresh (force refresh or cache is old)
         now = datetime.now()
         cache_expired = (self._cache_timestamp is None or
@@ -91,10 +145,12 @@ class DynamicManagerMapping:
             if fresh_mapping:  # Only update cache if we got data
                 self._cached_mapping = fresh_mapping
                 self._cache_timestamp = now
+                self._cache_version += 1
                 logger.info("Manager mapping cache updated")
             elif not self._cached_mapping:  # Fallback to static mapping if no cache and fetch failed
                 logger.warning("Using fallback static manager mapping")
                 self._cached_mapping = self._get_fallback_mapping()
+                self._cache_version += 1
 
         return self._cached_mapping
 
@@ -258,84 +314,187 @@ NAME_VARIATIONS: Dict[str, str] = {
 }
 
 
-def normalize_name(name: str) -> str:
+def normalize_name(name: str, mapping: Optional[Dict[str, str]] = None) -> str:
     """
     Normalize employee name to match the mapping
     Handles case variations and common name differences
+
+    Args:
+        name: Employee name to normalize
+        mapping: Already-fetched mapping to match against (fetched if omitted)
     """
     if not name:
         return ""
 
-    # Get current mapping from Google Sheets
-    reporting_managers = _manager_mapping_instance.get_current_mapping()
+    # Get current mapping from Google Sheets unless the caller already has it
+    reporting_managers = mapping if mapping is not None else _manager_mapping_instance.get_current_mapping()
 
-    # Try exact match first
-    if name in reporting_managers:
-        return name
+    # Results only change when the cached mapping is replaced, so memoize per cache version
+    if reporting_managers is _manager_mapping_instance._cached_mapping:
+        return _normalize_name_cached(name, _manager_mapping_instance._cache_version)
 
-    # Try case-insensitive match
-    name_lower = name.lower()
-    for mapped_name in reporting_managers:
-        if mapped_name.lower() == name_lower:
-            return mapped_name
+    return _match_name(name, reporting_managers)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name_cached(name: str, cache_version: int) -> str:
+    """Memoized normalize_name against the cached mapping (keyed on its version)"""
+    return _match_name(name, _manager_mapping_instance._cached_mapping)
+
+
+@dataclass(frozen=True)
+class _Normalized:
+    """Lowercase-keyed lookup structures derived from one mapping"""
+    reporting_lower: Dict[str, str]
+    alias: Dict[str, str]
+    emails_lower: Dict[str, str]
+    employees_by_manager: Dict[str, List[str]]
+    first_name_index: Dict[str, List[Tuple[str, str]]]
+    first_last_index: Dict[Tuple[str, str], str]
+    sorted_lower: List[Tuple[str, str]]
+    manager_counts: Counter
+    unique_managers: FrozenSet[str]
 
-    # Try name variations (this should catch Shruti Kamle -> Shruti Kamble)
-    if name in NAME_VARIATIONS:
-        return NAME_VARIATIONS[name]
 
-    # Try case-insensitive name variations
+def _build_lookup_tables(reporting_managers: Dict[str, str]) -> _Normalized:
+    """
+    Build case-folded lookup tables for case-insensitive matching
+    The first key wins on case collisions, matching the old linear scans
+    """
+    reporting_lower = {}
+    for mapped_name in reporting_managers:
+        reporting_lower.setdefault(mapped_name.casefold(), mapped_name)
+
+    # Unified alias lookup: mapped names take precedence over name variations
+    alias = dict(reporting_lower)
     for variation, canonical in NAME_VARIATIONS.items():
-        if variation.lower() == name_lower:
-            return canonical
+        alias.setdefault(variation.casefold(), canonical)
+
+    emails_lower = {}
+    for mapped_manager, email in MANAGER_EMAILS.items():
+        emails_lower.setdefault(mapped_manager.casefold(), email)
+
+    # Split every mapped name once into lowercase (first, last) parts; names
+    # with fewer than two parts never take part in the fuzzy fallbacks
+    name_parts = {}
+    for mapped_name in reporting_managers:
+        mapped_parts = mapped_name.split()
+        if len(mapped_parts) >= 2:
+            name_parts[mapped_name] = (mapped_parts[0].casefold(), mapped_parts[-1].casefold())
+
+    # First-name index of (name, last name) pairs, in mapping order, and
+    # (first, last) index for the fuzzy and partial-match fallbacks
+    first_name_index = {}
+    first_last_index = {}
+    for mapped_name, (mapped_first, mapped_last) in name_parts.items():
+        first_name_index.setdefault(mapped_first, []).append((mapped_name, mapped_last))
+        first_last_index.setdefault((mapped_first, mapped_last), mapped_name)
+
+    # Team sizes per manager, counted in a single pass
+    manager_counts = Counter(manager for manager in reporting_managers.values() if manager)
+
+    # Sorted lowercase names for prefix search with bisect
+    sorted_lower = sorted((mapped_name.casefold(), mapped_name) for mapped_name in reporting_managers)
+
+    # Reverse index: lowercase manager name -> sorted list of their employees
+    employees_by_manager = {}
+    for employee, manager in reporting_managers.items():
+        if manager:
+            employees_by_manager.setdefault(manager.casefold(), []).append(employee)
+    for employees in employees_by_manager.values():
+        employees.sort()
+
+    return _Normalized(
+        reporting_lower=reporting_lower,
+        alias=alias,
+        emails_lower=emails_lower,
+        employees_by_manager=employees_by_manager,
+        first_name_index=first_name_index,
+        first_last_index=first_last_index,
+        sorted_lower=sorted_lower,
+        manager_counts=manager_counts,
+        unique_managers=frozenset(manager_counts),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_lookup_tables(cache_version: int) -> _Normalized:
+    """Lookup tables for the cached mapping, rebuilt once per cache version"""
+    return _build_lookup_tables(_manager_mapping_instance._cached_mapping)
+
+
+def _get_lookup_tables(reporting_managers: Dict[str, str]) -> _Normalized:
+    """Get lookup tables for a mapping, reusing the prebuilt ones for the cached mapping"""
+    if reporting_managers is _manager_mapping_instance._cached_mapping:
+        return _cached_lookup_tables(_manager_mapping_instance._cache_version)
+    return _build_lookup_tables(reporting_managers)
+
+
+def _match_name(name: str, reporting_managers: Dict[str, str]) -> str:
+    """Match a name against the given mapping, falling back to the name itself"""
+    # Try exact match first
+    if name in reporting_managers:
+        return name
+
+    # Try case-insensitive match, then name variations
+    # (this should catch Shruti Kamle -> Shruti Kamble); fold case once and reuse it
+    name_lower = name.casefold()
+    tables = _get_lookup_tables(reporting_managers)
+    mapped_name = tables.alias.get(name_lower)
+    if mapped_name:
+        return mapped_name
 
     # Try fuzzy matching for similar spellings (like Kamle vs Kamble)
-    name_parts = name.split()
+    name_parts = name_lower.split()
     if len(name_parts) >= 2:
-        first_name = name_parts[0].lower()
-        last_name = name_parts[-1].lower()
+        first_name = name_parts[0]
+        last_name = name_parts[-1]
 
         # Look for best match based on first name and similar last name
         best_match = None
         best_score = 0
 
-        for mapped_name in reporting_managers:
-            mapped_parts = mapped_name.split()
-            if len(mapped_parts) >= 2:
-                mapped_first = mapped_parts[0].lower()
-                mapped_last = mapped_parts[-1].lower()
-
-                # Exact first name match
-                if mapped_first == first_name:
-                    # Calculate similarity score for last name
-                    score = calculate_name_similarity(last_name, mapped_last)
-                    if score > best_score and score > 0.7:  # Threshold for similarity
-                        best_score = score
-                        best_match = mapped_name
+        # Only names with an exact first name match are candidates
+        for mapped_name, mapped_last in tables.first_name_index.get(first_name, ()):
+            # Calculate similarity score for last name
+            score = calculate_name_similarity(last_name, mapped_last)
+            if score > best_score and score > 0.7:  # Threshold for similarity
+                best_score = score
+                best_match = mapped_name
 
         if best_match:
             return best_match
 
     # Try partial match (first name + last name) - exact match only
     if len(name_parts) >= 2:
-        for mapped_name in reporting_managers:
-            mapped_parts = mapped_name.split()
-            if len(mapped_parts) >= 2:
-                if (name_parts[0].lower() == mapped_parts[0].lower() and
-                    name_parts[-1].lower() == mapped_parts[-1].lower()):
-                    return mapped_name
+        mapped_name = tables.first_last_index.get((first_name, last_name))
+        if mapped_name:
+            return mapped_name
 
     # Try just first name match (only if no better match found)
     if len(name_parts) >= 1:
-        first_name = name_parts[0].lower()
+        first_name = name_parts[0]
+        # Names sharing the prefix are contiguous in the sorted list; two are enough to know it's ambiguous
+        sorted_lower = tables.sorted_lower
+        start = bisect.bisect_left(sorted_lower, (first_name,))
         matches = []
-        for mapped_name in reporting_managers:
-            if mapped_name.lower().startswith(first_name):
+        for mapped_lower, mapped_name in sorted_lower[start:start + 2]:
+            if mapped_lower.startswith(first_name):
                 matches.append(mapped_name)
 
         # If only one match, return it; otherwise, don't guess
         if len(matches) == 1:
             return matches[0]
 
+        # Last resort: close whole-name match (typos, reordered words) when rapidfuzz is installed
+        if fuzz_process is not None and len(name_parts) >= 2:
+            match = fuzz_process.extractOne(
+                name_lower, [mapped_lower for mapped_lower, _ in sorted_lower],
+                scorer=fuzz.token_sort_ratio, score_cutoff=85
+            )
+            if match:
+                return tables.reporting_lower[match[0]]
+
     return name
 
 
@@ -392,12 +551,18 @@ def get_manager_name(employee_name: str, force_refresh: bool = False) -> Optiona
         Manager's name or None if not found
     """
     reporting_managers = _manager_mapping_instance.get_current_mapping(force_refresh=force_refresh)
-    normalized_name = normalize_name(employee_name)
+    return _lookup_manager_name(employee_name, reporting_managers)
+
+
+def _lookup_manager_name(employee_name: str, reporting_managers: Dict[str, str]) -> Optional[str]:
+    """Look up the manager's name for an employee in an already-fetched mapping"""
+    normalized_name = normalize_name(employee_name, reporting_managers)
     manager = reporting_managers.get(normalized_name)
 
     if not manager:
         logger.warning(f"No manager found for employee: {employee_name} (normalized: {normalized_name})")
-        logger.debug(f"Available employees in mapping: {list(reporting_managers.keys())[:10]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Available employees in mapping: {list(reporting_managers)[:10]}...")
 
     return manager
 
@@ -412,20 +577,28 @@ def get_manager_email(employee_name: str, force_refresh: bool = False) -> Option
     Returns:
         Manager's email address or None if not found
     """
-    manager_name = get_manager_name(employee_name, force_refresh=force_refresh)
+    reporting_managers = _manager_mapping_instance.get_current_mapping(force_refresh=force_refresh)
+    if reporting_managers is _manager_mapping_instance._cached_mapping:
+        return _manager_email_cached(employee_name, _manager_mapping_instance._cache_version)
+    return _lookup_manager_email(employee_name, reporting_managers)
+
+
+@functools.lru_cache(maxsize=2048)
+def _manager_email_cached(employee_name: str, cache_version: int) -> Optional[str]:
+    """Memoized manager email lookup against the cached mapping"""
+    return _lookup_manager_email(employee_name, _manager_mapping_instance._cached_mapping)
+
+
+def _lookup_manager_email(employee_name: str, reporting_managers: Dict[str, str]) -> Optional[str]:
+    """Look up the manager's email for an employee in an already-fetched mapping"""
+    manager_name = _lookup_manager_name(employee_name, reporting_managers)
     
     if not manager_name:
         return None
     
-    # Handle case variations in manager names
-    manager_email = MANAGER_EMAILS.get(manager_name)
-    
-    if not manager_email:
-        # Try case-insensitive match for manager email
-        for mapped_manager, email in MANAGER_EMAILS.items():
-            if mapped_manager.lower() == manager_name.lower():
-                manager_email = email
-                break
+    # Exact match first, then case variations in manager names
+    manager_email = (MANAGER_EMAILS.get(manager_name)
+                     or _get_lookup_tables(reporting_managers).emails_lower.get(manager_name.casefold()))
     
     if not manager_email:
         logger.warning(f"No email found for manager: {manager_name}")
@@ -445,14 +618,9 @@ def get_all_manager_emails(employee_names: List[str]) -> List[str]:
     Returns:
         List of unique manager email addresses
     """
-    manager_emails = set()
-    
-    for employee in employee_names:
-        email = get_manager_email(employee)
-        if email:
-            manager_emails.add(email)
-    
-    return sorted(list(manager_emails))
+    # Repeated names hit the get_manager_email cache
+    manager_emails = {email for email in map(get_manager_email, employee_names) if email}
+    return sorted(manager_emails)
 
 
 def get_employees_by_manager(manager_name: str) -> List[str]:
@@ -465,20 +633,10 @@ def get_employees_by_manager(manager_name: str) -> List[str]:
     Returns:
         List of employee names
     """
-    employees = []
-    
-    # Handle case variations
-    manager_variations = [manager_name]
-    for mapped_manager in MANAGER_EMAILS:
-        if mapped_manager.lower() == manager_name.lower():
-            manager_variations.append(mapped_manager)
-    
+    # Handle case variations via the lowercase-keyed reverse index
     reporting_managers = _manager_mapping_instance.get_current_mapping()
-    for employee, manager in reporting_managers.items():
-        if manager in manager_variations:
-            employees.append(employee)
-    
-    return sorted(employees)
+    employees_by_manager = _get_lookup_tables(reporting_managers).employees_by_manager
+    return list(employees_by_manager.get(manager_name.casefold(), []))
 
 
 def get_manager_summary() -> Dict[str, Dict]:
@@ -490,24 +648,16 @@ def get_manager_summary() -> Dict[str, Dict]:
     """
     summary = {}
     
-    # Get unique managers
+    # Unique (non-empty) managers are precomputed with the lookup tables
     reporting_managers = _manager_mapping_instance.get_current_mapping()
-    unique_managers = set()
-    for manager in reporting_managers.values():
-        if manager:  # Skip empty managers
-            unique_managers.add(manager)
-    
-    for manager in unique_managers:
-        employees = get_employees_by_manager(manager)
+    tables = _get_lookup_tables(reporting_managers)
+    emails_lower = tables.emails_lower
+    employees_by_manager = tables.employees_by_manager
+    for manager in tables.unique_managers:
+        employees = list(employees_by_manager.get(manager.casefold(), []))
         
         # Get email handling case variations
-        email = MANAGER_EMAILS.get(manager, 'Not configured')
-        if email == 'Not configured':
-            # Try case-insensitive match
-            for mapped_manager, mapped_email in MANAGER_EMAILS.items():
-                if mapped_manager.lower() == manager.lower():
-                    email = mapped_email
-                    break
+        email = MANAGER_EMAILS.get(manager) or emails_lower.get(manager.casefold(), 'Not configured')
         
         summary[manager] = {
             'email': email,
@@ -532,35 +682,24 @@ def validate_mapping() -> Dict[str, List[str]]:
         'employees_without_managers': []
     }
     
-    # Check for managers without emails
+    # Check for managers without emails (exact or case-insensitive match)
     reporting_managers = _manager_mapping_instance.get_current_mapping()
-    all_managers = set()
-    for manager in reporting_managers.values():
-        if manager:
-            all_managers.add(manager)
-
-    for manager in all_managers:
-        found_email = False
-        # Check exact match and case-insensitive match
-        for mapped_manager in MANAGER_EMAILS:
-            if mapped_manager.lower() == manager.lower():
-                found_email = True
-                break
-        if not found_email:
-            issues['managers_without_emails'].append(manager)
+    tables = _get_lookup_tables(reporting_managers)
+    emails_lower = tables.emails_lower
+    issues['managers_without_emails'] = sorted(
+        manager for manager in tables.unique_managers if manager.casefold() not in emails_lower
+    )
 
     # Check for employees without managers
     for employee, manager in reporting_managers.items():
         if not manager:
             issues['employees_without_managers'].append(employee)
 
-    # Check for duplicate employee entries
-    employee_counts = {}
-    for employee in reporting_managers:
-        employee_lower = employee.lower()
-        if employee_lower in employee_counts:
-            issues['duplicate_employees'].append(employee)
-        employee_counts[employee_lower] = employee_counts.get(employee_lower, 0) + 1
+    # Check for duplicate employee entries (keys differing only by case)
+    employee_counts = Counter(employee.casefold() for employee in reporting_managers)
+    issues['duplicate_employees'] = [
+        employee for employee in reporting_managers if employee_counts[employee.casefold()] > 1
+    ]
     
     return issues
 
@@ -569,37 +708,36 @@ def print_manager_report():
     """
     Print a formatted report of all managers and their teams
     """
-    print("\n" + "="*60)
-    print("MANAGER REPORT - UPDATED")
-    print("="*60)
-    
     summary = get_manager_summary()
-    
+
+    # Build the whole report first and emit it with a single write
+    lines = ["\n" + "="*60, "MANAGER REPORT - UPDATED", "="*60]
+
     for manager, info in sorted(summary.items()):
-        print(f"\nManager: {manager}")
-        print(f"Email: {info['email']}")
-        print(f"Team Size: {info['team_size']}")
-        print("Team Members:")
-        for employee in info['employees']:
-            print(f"  - {employee}")
-    
-    print("\n" + "="*60)
-    print(f"Total Managers: {len(summary)}")
+        lines.append(f"\nManager: {manager}")
+        lines.append(f"Email: {info['email']}")
+        lines.append(f"Team Size: {info['team_size']}")
+        lines.append("Team Members:")
+        lines.extend(f"  - {employee}" for employee in info['employees'])
+
     reporting_managers = _manager_mapping_instance.get_current_mapping()
-    print(f"Total Employees: {len(reporting_managers)}")
-    print("="*60)
+    lines.append("\n" + "="*60)
+    lines.append(f"Total Managers: {len(summary)}")
+    lines.append(f"Total Employees: {len(reporting_managers)}")
+    lines.append("="*60)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def get_mapping_stats():
     """Get mapping statistics"""
     reporting_managers = _manager_mapping_instance.get_current_mapping()
-    unique_managers = set(reporting_managers.values())
+    tables = _get_lookup_tables(reporting_managers)
     return {
         'total_employees': len(reporting_managers),
-        'unique_managers': len(unique_managers),
+        'unique_managers': len(tables.unique_managers),
         'managers_with_emails': len(MANAGER_EMAILS),
-        'largest_team': max([list(reporting_managers.values()).count(manager)
-                           for manager in unique_managers] or [0])
+        'largest_team': max(tables.manager_counts.values(), default=0)
     }
 
 
@@ -1,15 +1,114 @@
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timedelta
+import functools
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from config.settings import Config
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from .activity_tracker import ActivityTracker, ActivityPeriod, WeeklyActivityReport
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson parses the (large) summary report JSON much faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Field names probed when extracting hours from a report item
+_HOUR_FIELDS = ('totalHours', 'total_hours', 'hoursWorked', 'totalTime', 'workTime', 'hours')
+_TIME_FIELDS = ('time', 'duration', 'elapsed', 'worked')
+_IDLE_FIELDS = ('idle_time', 'inactiveTime', 'inactive_time', 'breakTime', 'break_time')
+_IDLE_INDICATORS = ('idle', 'inactive', 'break', 'away')
+_EXCLUDED_KEYS = frozenset({'id', 'userId', 'timestamp', 'date'})
+
+# Pooled session shared by every TeamLoggerClient in the process, so the Streamlit
+# pages that build a fresh client per render don't pay a new TLS handshake each time
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Return the process-wide TeamLogger session, creating it on first use"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=max(16, Config.WORKFLOW_PARALLELISM),
+                max_retries=Retry(total=Config.MAX_RETRY_ATTEMPTS, backoff_factor=0.3,
+                                  status_forcelist=[429, 500, 502, 503, 504],
+                                  allowed_methods=['GET'])
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _shared_session = session
+        return _shared_session
+
+@functools.lru_cache(maxsize=2)
+def _previous_work_week_for(today_date: date) -> tuple[datetime, datetime]:
+    """Work week range to check on a given day; only depends on the date, so it is memoized"""
+    today = datetime(today_date.year, today_date.month, today_date.day)
+    
+    # If today is Monday, we want to check the previous week
+    # Otherwise, we check the current week up to Friday
+    if today.weekday() == 0:  # Monday
+        # Get previous week (Monday to Friday)
+        last_friday = today - timedelta(days=3)  # Previous Friday
+        last_monday = last_friday - timedelta(days=4)  # Previous Monday
+    else:
+        # Get current week up to Friday or today if before Friday
+        current_monday = today - timedelta(days=today.weekday())
+        current_friday = current_monday + timedelta(days=4)
+        
+        # If it's weekend, use the completed week
+        if today.weekday() >= 5:  # Saturday or Sunday
+            last_monday = current_monday
+            last_friday = current_friday
+        else:
+            # Use current week but only up to today or Friday (whichever is earlier)
+            last_monday = current_monday
+            last_friday = min(current_friday, today)
+    
+    # Set times to cover the full day
+    start_time = last_monday.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_time = last_friday.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return start_time, end_time
+
+
+def _sum_chart_hours(chart) -> float:
+    """Sum the positive second values of a chart dict, in hours"""
+    if not isinstance(chart, dict):
+        return 0
+    total_hours = 0
+    for value in chart.values():
+        if isinstance(value, (int, float)) and value > 0:
+            total_hours += value / 3600  # Convert seconds to hours
+    return total_hours
+
+
+def _first_positive_hours(employee_data: Dict, fields: tuple) -> Optional[float]:
+    """Hours from the first positive numeric field; values over 1000 are taken as seconds"""
+    for field in fields:
+        value = employee_data.get(field)
+        if isinstance(value, (int, float)) and value > 0:
+            total_hours = value / 3600 if value > 1000 else value
+            logger.debug("Extracted %.2f hours from %s", total_hours, field)
+            return total_hours
+    return None
+
+
 class TeamLoggerClient:
-    def __init__(self):
+    # Summary reports kept per client; the oldest range is dropped beyond this
+    _REPORT_CACHE_SIZE = 8
+
+    def __init__(self, session: Optional[requests.Session] = None):
         # Extract base URL without query parameters
         base_url = Config.TEAMLOGGER_API_URL
         if '?' in base_url:
@@ -20,10 +119,48 @@ class TeamLoggerClient:
         self.base_url = base_url
         self.headers = {
             'Authorization': f'Bearer {Config.TEAMLOGGER_BEARER_TOKEN}',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         }
+        # Persistent session so repeated report fetches reuse pooled TCP/TLS connections.
+        # Auth headers go on each request, so an injected session can be shared safely
+        self._session = session if session is not None else _get_shared_session()
+        # Summary reports keyed by (start_ms, end_ms) -> [fetched_at, data, id_index, etag].
+        # Expired entries are kept for ETag revalidation, so the dict is capped instead
+        self._report_cache = OrderedDict()
+        self._report_cache_lock = threading.Lock()
+        # Fixed pool of locks picked by hashing the range, so each range is fetched once at a time
+        # without keeping a lock per range ever seen
+        self._report_locks = [threading.Lock() for _ in range(16)]
+        self._cache_ttl = Config.TEAMLOGGER_REPORT_CACHE_TTL
+        # Summing every numeric field is a guess; only do it when explicitly enabled
+        self._enable_fallback_sum = Config.TEAMLOGGER_FALLBACK_SUM
+        # Hour extractors in priority order, see _extract_total_hours
+        self._extractors = (
+            self._extract_direct_total,
+            self._extract_totchart,
+            self._extract_actchart,
+            self._extract_hour_fields,
+            self._extract_time_fields,
+            self._extract_numeric_sum,
+        )
         self.activity_tracker = ActivityTracker()
         logger.info(f"TeamLogger base URL: {self.base_url}")
+
+    def close(self):
+        """Release the client. The HTTP session is left open: it is either the process-wide
+        pooled session or one injected by the caller, and both outlive this client"""
+
+    def clear_cache(self):
+        """Clear the summary report cache"""
+        self._report_cache = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _get_timestamp(self, dt: datetime) -> int:
         """Convert datetime to milliseconds timestamp"""
@@ -35,33 +172,8 @@ class TeamLoggerClient:
         For Monday deployments, this gets the previous week's data
         For other days, gets the current week's data up to today
         """
-        today = datetime.now()
-        
-        # If today is Monday, we want to check the previous week
-        # Otherwise, we check the current week up to Friday
-        if today.weekday() == 0:  # Monday
-            # Get previous week (Monday to Friday)
-            last_friday = today - timedelta(days=3)  # Previous Friday
-            last_monday = last_friday - timedelta(days=4)  # Previous Monday
-        else:
-            # Get current week up to Friday or today if before Friday
-            current_monday = today - timedelta(days=today.weekday())
-            current_friday = current_monday + timedelta(days=4)
-            
-            # If it's weekend, use the completed week
-            if today.weekday() >= 5:  # Saturday or Sunday
-                last_monday = current_monday
-                last_friday = current_friday
-            else:
-                # Use current week but only up to today or Friday (whichever is earlier)
-                last_monday = current_monday
-                last_friday = min(current_friday, today)
-        
-        # Set times to cover the full day
-        start_time = last_monday.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_time = last_friday.replace(hour=23, minute=59, second=59, microsecond=999999)
-        
-        logger.info(f"Checking work week: {start_time.date()} to {end_time.date()}")
+        start_time, end_time = _previous_work_week_for(datetime.now().date())
+        logger.debug(f"Checking work week: {start_time.date()} to {end_time.date()}")
         return start_time, end_time
     
     def get_employee_summary_report(self, start_date: datetime = None, end_date: datetime = None) -> Optional[Dict]:
@@ -78,17 +190,41 @@ class TeamLoggerClient:
                 'startTime': self._get_timestamp(start_date),
                 'endTime': self._get_timestamp(end_date)
             }
-            
-            logger.info(f"Fetching summary report from: {endpoint}")
-            logger.info(f"Date range: {start_date.date()} to {end_date.date()}")
-            logger.debug(f"Parameters: {params}")
-            
-            response = requests.get(endpoint, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.debug(f"Received {len(data) if isinstance(data, list) else 'non-list'} records from API")
-            return data
+
+            # Reuse a recent report for the same range instead of refetching per employee
+            cache_key = (params['startTime'], params['endTime'])
+            cached = self._report_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self._cache_ttl:
+                logger.debug(f"Using cached summary report for {start_date.date()} to {end_date.date()}")
+                return cached[1]
+            
+            # Concurrent callers for the same range wait for one request instead of each sending their own
+            with self._report_locks[hash(cache_key) % len(self._report_locks)]:
+                cached = self._report_cache.get(cache_key)
+                if cached and time.monotonic() - cached[0] < self._cache_ttl:
+                    logger.debug(f"Using cached summary report for {start_date.date()} to {end_date.date()}")
+                    return cached[1]
+
+                logger.info("Fetching summary report from: %s (%s to %s)", endpoint, start_date.date(), end_date.date())
+                logger.debug("Parameters: %s", params)
+
+                # Revalidate an expired report with its ETag; a 304 has no body to download
+                headers = self.headers
+                if cached and cached[3]:
+                    headers = {**self.headers, 'If-None-Match': cached[3]}
+                response = self._session.get(endpoint, params=params, headers=headers,
+                                             timeout=(5, Config.API_REQUEST_TIMEOUT))
+                if response.status_code == 304 and cached:
+                    logger.debug("Summary report not modified, reusing cached copy")
+                    cached[0] = time.monotonic()
+                    self._store_report(cache_key, cached)
+                    return cached[1]
+                response.raise_for_status()
+
+                data = orjson.loads(response.content) if orjson is not None else response.json()
+                logger.debug(f"Received {len(data) if isinstance(data, list) else 'non-list'} records from API")
+                self._store_report(cache_key, [time.monotonic(), data, None, response.headers.get('ETag')])
+                return data
             
         except requests.RequestException as e:
             logger.error(f"Error fetching summary report: {str(e)}")
@@ -100,10 +236,53 @@ class TeamLoggerClient:
             logger.error(f"Unexpected error fetching summary report: {str(e)}")
             return None
     
-    def get_all_employees(self) -> List[Dict]:
+    def _store_report(self, cache_key: Tuple[int, int], entry: List) -> None:
+        """Cache a report as the most recent range, dropping the oldest beyond _REPORT_CACHE_SIZE"""
+        with self._report_cache_lock:
+            self._report_cache[cache_key] = entry
+            self._report_cache.move_to_end(cache_key)
+            while len(self._report_cache) > self._REPORT_CACHE_SIZE:
+                self._report_cache.popitem(last=False)
+
+    def get_summaries_for_ranges(self, ranges: List[Tuple[datetime, datetime]]) -> List[Optional[Dict]]:
+        """
+        Fetch summary reports for several date ranges concurrently
+        Results are returned in the same order as ranges; failed fetches are None
+        """
+        if not ranges:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(ranges))) as executor:
+            return list(executor.map(lambda date_range: self.get_employee_summary_report(*date_range), ranges))
+
+    def _index_report(self, report: List[Dict]) -> Dict[str, Dict]:
+        """Index report items by employee id (first occurrence wins, like a linear scan)"""
+        index = {}
+        for item in report:
+            index.setdefault(str(item.get('id', '')), item)
+        return index
+
+    def _get_report_index(self, start_date: datetime, end_date: datetime) -> Optional[Dict[str, Dict]]:
+        """
+        Get the summary report for a period as an id -> item index
+        The index is built once per cached report and reused by later lookups
+        """
+        report = self.get_employee_summary_report(start_date, end_date)
+        if not report or not isinstance(report, list):
+            return None
+
+        cached = self._report_cache.get((self._get_timestamp(start_date), self._get_timestamp(end_date)))
+        if cached is None or cached[1] is not report:
+            return self._index_report(report)
+        if cached[2] is None:
+            cached[2] = self._index_report(report)
+        return cached[2]
+
+    def get_all_employees(self, include_raw: bool = False) -> List[Dict]:
         """
         Get all active employees from the summary report
         Returns list of employee dictionaries with id, name, email, status
+        Set include_raw to also attach the raw report item under '_raw_data'
         """
         try:
             report = self.get_employee_summary_report()
@@ -120,13 +299,14 @@ class TeamLoggerClient:
                         'id': str(item.get('id', '')),
                         'name': item.get('title', 'Unknown'),  # 'title' contains the employee name
                         'email': item.get('email', f"employee{len(employees)+1}@company.com"),
-                        'status': 'active',
-                        # Store raw data for debugging
-                        '_raw_data': item
+                        'status': 'active'
                     }
+                    if include_raw:
+                        # Store raw data for debugging
+                        employee['_raw_data'] = item
                     if employee['id']:  # Only add if we have an ID
                         employees.append(employee)
-                        logger.debug(f"Found employee: {employee['name']} ({employee['id']})")
+                        logger.debug("Found employee: %s (%s)", employee['name'], employee['id'])
                 
                 logger.info(f"Extracted {len(employees)} employees from report")
                 return employees
@@ -138,158 +318,83 @@ class TeamLoggerClient:
             logger.error(f"Error processing employees: {str(e)}")
             return []
     
-    def get_weekly_summary(self, employee_id: str, start_date: datetime = None, end_date: datetime = None) -> Optional[Dict]:
+    def get_weekly_summary(self, employee_id: str, start_date: datetime = None, end_date: datetime = None,
+                           debug: bool = False) -> Optional[Dict]:
         """
         Get weekly summary for an employee for the specified work week
         Returns dictionary with total_hours, days_worked, start_date, end_date
+        Set debug to also include the raw report item under 'raw_data'
         """
         try:
             if start_date is None or end_date is None:
                 start_date, end_date = self._get_previous_work_week()
             
-            # Get the full report for the specified period
-            report = self.get_employee_summary_report(start_date, end_date)
+            # Get the full report for the specified period, indexed by employee id
+            report_index = self._get_report_index(start_date, end_date)
             
-            if not report:
+            if report_index is None:
                 logger.warning(f"No report data available for employee {employee_id}")
                 return None
             
             # Find the employee in the report
-            employee_data = None
-            
-            if isinstance(report, list):
-                for item in report:
-                    if str(item.get('id', '')) == str(employee_id):
-                        employee_data = item
-                        break
+            employee_data = report_index.get(str(employee_id))
             
             if not employee_data:
                 logger.warning(f"Employee {employee_id} not found in report for week {start_date.date()} to {end_date.date()}")
                 return None
             
-            # Extract hours from the data with multiple methods
-            active_hours = self._extract_total_hours(employee_data)  # Now returns active hours (total - idle)
-            idle_hours = self._extract_idle_hours(employee_data)
-            original_total_hours = active_hours + idle_hours
-
-            # Calculate actual working days in the period
-            working_days = self._count_working_days(start_date, end_date)
-
-            logger.debug(f"Employee {employee_id}: {active_hours:.2f} active hours (original: {original_total_hours:.2f}h, idle: {idle_hours:.2f}h) over {working_days} working days")
-
-            return {
-                'employee_id': employee_id,
-                'total_hours': round(active_hours, 2),  # Now represents active hours for monitoring
-                'original_total_hours': round(original_total_hours, 2),  # Original logged hours
-                'idle_hours': round(idle_hours, 2),  # Idle time excluded
-                'days_worked': working_days,
-                'start_date': start_date.date(),
-                'end_date': end_date.date(),
-                'week_period': f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
-                'raw_data': employee_data  # Include for debugging
-            }
+            summary = self._build_weekly_summary(employee_id, employee_data, start_date, end_date)
+            if debug:
+                summary['raw_data'] = employee_data  # Include for debugging
+            return summary
             
         except Exception as e:
             logger.error(f"Error fetching weekly summary for {employee_id}: {str(e)}")
             return None
+
+    def _build_weekly_summary(self, employee_id: str, employee_data: Dict, start_date: datetime, end_date: datetime) -> Dict:
+        """Build the weekly summary dictionary from an employee's report item"""
+        # Extract hours from the data with multiple methods (idle time is computed once)
+        active_hours, idle_hours = self._extract_hours(employee_data)
+        original_total_hours = active_hours + idle_hours
+
+        # Calculate actual working days in the period
+        working_days = self._count_working_days(start_date, end_date)
+
+        logger.debug("Employee %s: %.2f active hours (original: %.2fh, idle: %.2fh) over %d working days",
+                     employee_id, active_hours, original_total_hours, idle_hours, working_days)
+
+        return {
+            'employee_id': employee_id,
+            'total_hours': round(active_hours, 2),  # Now represents active hours for monitoring
+            'original_total_hours': round(original_total_hours, 2),  # Original logged hours
+            'idle_hours': round(idle_hours, 2),  # Idle time excluded
+            'days_worked': working_days,
+            'start_date': start_date.date(),
+            'end_date': end_date.date(),
+            'week_period': f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+        }
     
-    def _extract_total_hours(self, employee_data: Dict) -> float:
+    def _extract_hours(self, employee_data: Dict) -> Tuple[float, float]:
+        """
+        Extract (active_hours, idle_hours) from employee data in one pass
+        Idle time is extracted once and shared with the active-hours calculation
+        """
+        idle_hours = self._extract_idle_hours(employee_data)
+        return self._extract_total_hours(employee_data, idle_hours=idle_hours), idle_hours
+
+    def _extract_total_hours(self, employee_data: Dict, idle_hours: Optional[float] = None) -> float:
         """
         Extract ACTIVE work hours from employee data (total hours minus idle time)
         This provides real working hours by excluding idle time for accurate monitoring
+        Pass idle_hours when it is already known to avoid extracting it again
         """
-        total_hours = 0
-        idle_hours = 0
-
         try:
-            # Method 0: Check for direct totalHours field (most reliable)
-            if 'totalHours' in employee_data:
-                total_hours = employee_data['totalHours']
-                if isinstance(total_hours, (int, float)) and total_hours > 0:
-                    logger.debug(f"Found totalHours: {total_hours:.2f} hours")
-
-                    # Extract idle time to subtract from total
-                    idle_hours = self._extract_idle_hours(employee_data)
-                    active_hours = max(0, total_hours - idle_hours)
-
-                    logger.info(f"📊 Hours calculation - Total: {total_hours:.2f}h, Idle: {idle_hours:.2f}h, Active: {active_hours:.2f}h")
-                    return active_hours
-
-            # Method 1: Check totChart for time data (most common)
-            if 'totChart' in employee_data and isinstance(employee_data['totChart'], dict):
-                for key, value in employee_data['totChart'].items():
-                    if isinstance(value, (int, float)) and value > 0:
-                        # Values in totChart are typically in seconds
-                        total_hours += value / 3600  # Convert seconds to hours
-
-                if total_hours > 0:
-                    # Extract idle time to subtract from total
-                    idle_hours = self._extract_idle_hours(employee_data)
-                    active_hours = max(0, total_hours - idle_hours)
-
-                    logger.info(f"📊 Hours calculation - Total: {total_hours:.2f}h, Idle: {idle_hours:.2f}h, Active: {active_hours:.2f}h")
-                    return active_hours
-            
-            # Method 2: Check actChart for activity data
-            if 'actChart' in employee_data and isinstance(employee_data['actChart'], dict):
-                for key, value in employee_data['actChart'].items():
-                    if isinstance(value, (int, float)) and value > 0:
-                        # Convert seconds to hours
-                        total_hours += value / 3600
-                
-                if total_hours > 0:
-                    logger.debug(f"Extracted {total_hours:.2f} hours from actChart")
-                    return total_hours
-            
-            # Method 3: Look for direct hour fields
-            hour_fields = ['totalHours', 'total_hours', 'hoursWorked', 'totalTime', 'workTime', 'hours']
-            for field in hour_fields:
-                if field in employee_data:
-                    value = employee_data[field]
-                    if isinstance(value, (int, float)) and value > 0:
-                        # Check if value is likely in seconds (> 1000) or hours
-                        if value > 1000:
-                            total_hours = value / 3600  # Convert seconds to hours
-                        else:
-                            total_hours = value  # Already in hours
-                        
-                        if total_hours > 0:
-                            logger.debug(f"Extracted {total_hours:.2f} hours from {field}")
-                            return total_hours
-            
-            # Method 4: Check for any time-related fields
-            time_fields = ['time', 'duration', 'elapsed', 'worked']
-            for field in time_fields:
-                if field in employee_data:
-                    value = employee_data[field]
-                    if isinstance(value, (int, float)) and value > 0:
-                        # Assume large values are in seconds
-                        if value > 1000:
-                            total_hours = value / 3600
-                        else:
-                            total_hours = value
-                        
-                        if total_hours > 0:
-                            logger.debug(f"Extracted {total_hours:.2f} hours from {field}")
-                            return total_hours
-            
-            # Method 5: Sum all reasonable numeric values (last resort)
-            numeric_sum = 0
-            for key, value in employee_data.items():
-                if (isinstance(value, (int, float)) and 
-                    value > 0 and 
-                    key not in ['id', 'userId', 'timestamp', 'date'] and
-                    not key.startswith('_')):
-                    numeric_sum += value
-            
-            if numeric_sum > 1000:  # Likely in seconds
-                total_hours = numeric_sum / 3600
-                logger.debug(f"Extracted {total_hours:.2f} hours from numeric sum of all fields")
-                return total_hours
-            elif numeric_sum > 0:  # Likely in hours
-                total_hours = numeric_sum
-                logger.debug(f"Extracted {total_hours:.2f} hours from numeric sum (assuming hours)")
-                return total_hours
+            # Try each extractor in priority order; the first one that applies wins
+            for extractor in self._extractors:
+                hours = extractor(employee_data, idle_hours)
+                if hours is not None:
+                    return hours
             
             # Log available fields for debugging
             available_fields = list(employee_data.keys())
@@ -298,7 +403,7 @@ class TeamLoggerClient:
             # Check if there are any chart-like structures
             for key, value in employee_data.items():
                 if isinstance(value, dict) and value:
-                    logger.debug(f"Found dict field '{key}' with keys: {list(value.keys())}")
+                    logger.debug("Found dict field '%s' with keys: %s", key, list(value.keys()))
             
             return 0
             
@@ -306,6 +411,67 @@ class TeamLoggerClient:
             logger.error(f"Error extracting hours: {str(e)}")
             return 0
 
+    # Hour extractors: each returns hours, or None when its fields are absent
+
+    def _active_from_total(self, employee_data: Dict, total_hours: float, idle_hours: Optional[float]) -> float:
+        """Subtract idle time from total hours"""
+        if idle_hours is None:
+            idle_hours = self._extract_idle_hours(employee_data)
+        active_hours = max(0, total_hours - idle_hours)
+        logger.debug("📊 Hours calculation - Total: %.2fh, Idle: %.2fh, Active: %.2fh", total_hours, idle_hours, active_hours)
+        return active_hours
+
+    def _extract_direct_total(self, employee_data: Dict, idle_hours: Optional[float]) -> Optional[float]:
+        """Method 0: direct totalHours field (most reliable), minus idle time"""
+        total_hours = employee_data.get('totalHours')
+        if isinstance(total_hours, (int, float)) and total_hours > 0:
+            logger.debug("Found totalHours: %.2f hours", total_hours)
+            return self._active_from_total(employee_data, total_hours, idle_hours)
+        return None
+
+    def _extract_totchart(self, employee_data: Dict, idle_hours: Optional[float]) -> Optional[float]:
+        """Method 1: totChart values in seconds (most common), minus idle time"""
+        total_hours = _sum_chart_hours(employee_data.get('totChart'))
+        if total_hours > 0:
+            return self._active_from_total(employee_data, total_hours, idle_hours)
+        return None
+
+    def _extract_actchart(self, employee_data: Dict, idle_hours: Optional[float]) -> Optional[float]:
+        """Method 2: actChart activity values in seconds"""
+        total_hours = _sum_chart_hours(employee_data.get('actChart'))
+        if total_hours > 0:
+            logger.debug("Extracted %.2f hours from actChart", total_hours)
+            return total_hours
+        return None
+
+    def _extract_hour_fields(self, employee_data: Dict, idle_hours: Optional[float]) -> Optional[float]:
+        """Method 3: direct hour fields"""
+        return _first_positive_hours(employee_data, _HOUR_FIELDS)
+
+    def _extract_time_fields(self, employee_data: Dict, idle_hours: Optional[float]) -> Optional[float]:
+        """Method 4: any time-related fields"""
+        return _first_positive_hours(employee_data, _TIME_FIELDS)
+
+    def _extract_numeric_sum(self, employee_data: Dict, idle_hours: Optional[float]) -> Optional[float]:
+        """Method 5: sum all reasonable numeric values (last resort, opt-in)"""
+        if not self._enable_fallback_sum:
+            return None
+        
+        numeric_sum = sum(
+            value for key, value in employee_data.items()
+            if type(value) in (int, float) and value > 0
+            and key not in _EXCLUDED_KEYS and not key.startswith('_')
+        )
+        
+        if numeric_sum > 1000:  # Likely in seconds
+            total_hours = numeric_sum / 3600
+            logger.debug("Extracted %.2f hours from numeric sum of all fields", total_hours)
+            return total_hours
+        elif numeric_sum > 0:  # Likely in hours
+            logger.debug("Extracted %.2f hours from numeric sum (assuming hours)", numeric_sum)
+            return numeric_sum
+        return None
+
     def _extract_idle_hours(self, employee_data: Dict) -> float:
         """
         Extract idle time from employee data
@@ -319,7 +485,7 @@ class TeamLoggerClient:
                 value = employee_data['idleHours']
                 if isinstance(value, (int, float)) and value >= 0:
                     idle_hours = value
-                    logger.debug(f"Found idleHours: {idle_hours:.2f} hours")
+                    logger.debug("Found idleHours: %.2f hours", idle_hours)
                     return idle_hours
 
             # Method 2: Calculate from active/inactive seconds
@@ -334,18 +500,18 @@ class TeamLoggerClient:
                     # Calculate idle time as a portion of inactive time
                     # Use inactive seconds as idle time (conservative approach)
                     idle_hours = inactive_seconds / 3600
-                    logger.debug(f"Calculated idle from seconds - Total: {total_seconds}s, Inactive: {inactive_seconds}s, Idle: {idle_hours:.2f}h")
+                    logger.debug("Calculated idle from seconds - Total: %ss, Inactive: %ss, Idle: %.2fh",
+                                 total_seconds, inactive_seconds, idle_hours)
                     return idle_hours
 
             # Method 3: Look for other idle-related fields
-            idle_fields = ['idle_time', 'inactiveTime', 'inactive_time', 'breakTime', 'break_time']
-            for field in idle_fields:
+            for field in _IDLE_FIELDS:
                 if field in employee_data:
                     value = employee_data[field]
                     if isinstance(value, (int, float)) and value > 0:
                         # Convert seconds to hours if needed
                         idle_hours = value / 3600 if value > 1000 else value
-                        logger.debug(f"Found idle time from {field}: {idle_hours:.2f} hours")
+                        logger.debug("Found idle time from %s: %.2f hours", field, idle_hours)
                         return idle_hours
 
             # Method 4: Check activity charts for idle indicators
@@ -353,12 +519,12 @@ class TeamLoggerClient:
                 chart_idle = 0
                 for key, value in employee_data['actChart'].items():
                     key_lower = key.lower()
-                    if any(indicator in key_lower for indicator in ['idle', 'inactive', 'break', 'away']):
+                    if any(indicator in key_lower for indicator in _IDLE_INDICATORS):
                         if isinstance(value, (int, float)) and value > 0:
                             chart_idle += value / 3600 if value > 1000 else value
 
                 if chart_idle > 0:
-                    logger.debug(f"Found idle time from actChart: {chart_idle:.2f} hours")
+                    logger.debug("Found idle time from actChart: %.2f hours", chart_idle)
                     return chart_idle
 
             logger.debug("No idle time data found - assuming 0 idle hours")
@@ -372,16 +538,14 @@ class TeamLoggerClient:
         """
         Count actual working days (Monday-Friday) in the given period
         """
-        working_days = 0
-        current_date = start_date.date()
-        end_date = end_date.date()
-        
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Monday=0, Friday=4
-                working_days += 1
-            current_date += timedelta(days=1)
-        
-        return working_days
+        days = (end_date.date() - start_date.date()).days + 1
+        if days <= 0:
+            return 0
+
+        # Every full week has 5 working days; only the remainder needs checking
+        full_weeks, remainder = divmod(days, 7)
+        start_weekday = start_date.weekday()
+        return full_weeks * 5 + sum(1 for i in range(remainder) if (start_weekday + i) % 7 < 5)  # Monday=0, Friday=4
     
     def is_employee_active_this_week(self, employee_id: str) -> bool:
         """
@@ -418,9 +582,10 @@ class TeamLoggerClient:
         try:
             logger.info("Validating TeamLogger API connection...")
             
-            # Test with a simple request
-            test_start = datetime.now() - timedelta(days=1)
-            test_end = datetime.now()
+            # Test with a simple request over the last full day. Day-aligned so repeated
+            # checks reuse one cache entry instead of adding a new range every call
+            test_end = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            test_start = test_end - timedelta(days=1)
             
             report = self.get_employee_summary_report(test_start, test_end)
             
@@ -471,19 +636,19 @@ class TeamLoggerClient:
         Get raw data for debugging purposes
         """
         try:
-            report = self.get_employee_summary_report()
+            report_index = self._get_report_index(*self._get_previous_work_week())
             
-            if not report or not isinstance(report, list):
+            if report_index is None:
                 return {'error': 'No report data available'}
             
-            for item in report:
-                if str(item.get('id', '')) == str(employee_id):
-                    return {
-                        'employee_id': employee_id,
-                        'raw_data': item,
-                        'available_fields': list(item.keys()),
-                        'extracted_hours': self._extract_total_hours(item)
-                    }
+            item = report_index.get(str(employee_id))
+            if item is not None:
+                return {
+                    'employee_id': employee_id,
+                    'raw_data': item,
+                    'available_fields': list(item.keys()),
+                    'extracted_hours': self._extract_total_hours(item)
+                }
             
             return {'error': f'Employee {employee_id} not found in report'}
             
@@ -497,47 +662,57 @@ class TeamLoggerClient:
         """
         try:
             employees = self.get_all_employees()
-            results = []
+            if not employees:
+                return []
             
             work_week_start, work_week_end = self._get_previous_work_week()
+            # Index the (cached) report once instead of looking each employee up through get_weekly_summary
+            report_index = self._get_report_index(work_week_start, work_week_end) or {}
             
-            for employee in employees:
-                try:
-                    weekly_data = self.get_weekly_summary(employee['id'], work_week_start, work_week_end)
-                    
-                    result = {
-                        'employee_id': employee['id'],
-                        'employee_name': employee['name'],
-                        'employee_email': employee['email'],
-                        'hours_worked': weekly_data['total_hours'] if weekly_data else 0,
-                        'working_days': weekly_data['days_worked'] if weekly_data else 0,
-                        'period_start': work_week_start.date(),
-                        'period_end': work_week_end.date(),
-                        'data_available': weekly_data is not None
-                    }
-                    
-                    results.append(result)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing employee {employee['name']}: {str(e)}")
-                    results.append({
-                        'employee_id': employee['id'],
-                        'employee_name': employee['name'],
-                        'employee_email': employee['email'],
-                        'hours_worked': 0,
-                        'working_days': 0,
-                        'period_start': work_week_start.date(),
-                        'period_end': work_week_end.date(),
-                        'data_available': False,
-                        'error': str(e)
-                    })
-            
-            return results
+            # Rows are independent; map() keeps them in employee order
+            with ThreadPoolExecutor(max_workers=min(16, len(employees))) as executor:
+                return list(executor.map(
+                    lambda employee: self._build_weekly_row(employee, report_index, work_week_start, work_week_end),
+                    employees
+                ))
             
         except Exception as e:
             logger.error(f"Error getting work week hours for all employees: {str(e)}")
             return []
 
+    def _build_weekly_row(self, employee: Dict, report_index: Dict[str, Dict],
+                          work_week_start: datetime, work_week_end: datetime) -> Dict:
+        """Build one get_work_week_hours_for_all row for an employee"""
+        try:
+            employee_data = report_index.get(employee['id'])
+            weekly_data = (self._build_weekly_summary(employee['id'], employee_data, work_week_start, work_week_end)
+                           if employee_data else None)
+            
+            return {
+                'employee_id': employee['id'],
+                'employee_name': employee['name'],
+                'employee_email': employee['email'],
+                'hours_worked': weekly_data['total_hours'] if weekly_data else 0,
+                'working_days': weekly_data['days_worked'] if weekly_data else 0,
+                'period_start': work_week_start.date(),
+                'period_end': work_week_end.date(),
+                'data_available': weekly_data is not None
+            }
+            
+        except Exception as e:
+            logger.error(f"Error processing employee {employee['name']}: {str(e)}")
+            return {
+                'employee_id': employee['id'],
+                'employee_name': employee['name'],
+                'employee_email': employee['email'],
+                'hours_worked': 0,
+                'working_days': 0,
+                'period_start': work_week_start.date(),
+                'period_end': work_week_end.date(),
+                'data_available': False,
+                'error': str(e)
+            }
+
     def get_employee_activity_data(self, employee_id: str, start_date: datetime, end_date: datetime) -> Optional[Dict]:
         """
         Get detailed activity data for an employee including actChart data
@@ -551,47 +726,48 @@ class TeamLoggerClient:
             Dictionary containing activity data or None if not found
         """
         try:
-            report = self.get_employee_summary_report(start_date, end_date)
+            report_index = self._get_report_index(start_date, end_date)
 
-            if not report or not isinstance(report, list):
+            if report_index is None:
                 logger.warning(f"No report data available for activity tracking")
                 return None
 
             # Find employee data in the report
-            for employee_data in report:
-                if str(employee_data.get('id', '')) == str(employee_id):
-                    # Extract activity data from the employee record
-                    active_minutes_ratio = employee_data.get('activeMinutesRatio', 0)
-                    active_seconds_ratio = employee_data.get('activeSecondsRatio', 0)
-                    active_seconds_count = employee_data.get('activeSecondsCount', 0)
-                    inactive_seconds_count = employee_data.get('inactiveSecondsCount', 0)
-                    total_seconds_count = employee_data.get('totalSecondsCount', 0)
-
-                    # Calculate activity percentage from the ratios
-                    activity_percentage = active_minutes_ratio * 100 if active_minutes_ratio else 0
-
-                    # Get basic employee info
-                    employee_info = {
-                        'employee_id': employee_id,
-                        'employee_name': employee_data.get('name', 'Unknown'),
-                        'employee_email': employee_data.get('email', ''),
-                        'period_start': start_date,
-                        'period_end': end_date,
-                        'activity_percentage': round(activity_percentage, 2),
-                        'active_minutes_ratio': active_minutes_ratio,
-                        'active_seconds_ratio': active_seconds_ratio,
-                        'active_seconds_count': active_seconds_count,
-                        'inactive_seconds_count': inactive_seconds_count,
-                        'total_seconds_count': total_seconds_count,
-                        'active_tuple_count': employee_data.get('activeTimeTupleCount', 0),
-                        'inactive_tuple_count': employee_data.get('inactiveTimeTupleCount', 0),
-                        'total_hours': self._extract_total_hours(employee_data),
-                        'idle_hours': self._extract_idle_hours(employee_data),
-                        'raw_data': employee_data
-                    }
-
-                    logger.info(f"Retrieved activity data for {employee_info['employee_name']}")
-                    return employee_info
+            employee_data = report_index.get(str(employee_id))
+            if employee_data is not None:
+                # Extract activity data from the employee record
+                active_minutes_ratio = employee_data.get('activeMinutesRatio', 0)
+                active_seconds_ratio = employee_data.get('activeSecondsRatio', 0)
+                active_seconds_count = employee_data.get('activeSecondsCount', 0)
+                inactive_seconds_count = employee_data.get('inactiveSecondsCount', 0)
+                total_seconds_count = employee_data.get('totalSecondsCount', 0)
+
+                # Calculate activity percentage from the ratios
+                total_hours, idle_hours = self._extract_hours(employee_data)
+                activity_percentage = active_minutes_ratio * 100 if active_minutes_ratio else 0
+
+                # Get basic employee info
+                employee_info = {
+                    'employee_id': employee_id,
+                    'employee_name': employee_data.get('name', 'Unknown'),
+                    'employee_email': employee_data.get('email', ''),
+                    'period_start': start_date,
+                    'period_end': end_date,
+                    'activity_percentage': round(activity_percentage, 2),
+                    'active_minutes_ratio': active_minutes_ratio,
+                    'active_seconds_ratio': active_seconds_ratio,
+                    'active_seconds_count': active_seconds_count,
+                    'inactive_seconds_count': inactive_seconds_count,
+                    'total_seconds_count': total_seconds_count,
+                    'active_tuple_count': employee_data.get('activeTimeTupleCount', 0),
+                    'inactive_tuple_count': employee_data.get('inactiveTimeTupleCount', 0),
+                    'total_hours': total_hours,
+                    'idle_hours': idle_hours,
+                    'raw_data': employee_data
+                }
+
+                logger.info(f"Retrieved activity data for {employee_info['employee_name']}")
+                return employee_info
 
             logger.warning(f"Employee {employee_id} not found in activity report")
             return None
@@ -1,29 +1,32 @@
+import functools
 import logging
 import os
+import re
 import sys
 from datetime import datetime
 from typing import Any
 
+# Runs of non-ASCII characters, stripped when the console can't encode them
+_NON_ASCII = re.compile(r'[^\x00-\x7F]+')
+
+@functools.lru_cache(maxsize=None)
 def setup_logging(log_level: str = 'INFO', log_file: str = 'logs/app.log'):
     """
     Setup logging configuration with UTF-8 encoding support
+    Repeated calls with the same arguments (e.g. Streamlit reruns) are no-ops
     """
     # Create logs directory if it doesn't exist
     log_dir = os.path.dirname(log_file)
     if log_dir and not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
-    # Force UTF-8 encoding for Windows console
+    # Force UTF-8 encoding for Windows console, in-process (no chcp subprocess)
     if sys.platform == 'win32':
-        import codecs
-        try:
-            # Set console code page to UTF-8
-            os.system('chcp 65001 > nul')
-            # Configure stdout and stderr to use UTF-8
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-        except Exception:
-            pass
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.reconfigure(encoding='utf-8', errors='replace')
+            except Exception:
+                pass
 
     # Configure logging handlers
     handlers = []
@@ -51,8 +54,7 @@ def setup_logging(log_level: str = 'INFO', log_file: str = 'logs/app.log'):
                     self.flush()
                 except UnicodeEncodeError:
                     # Strip non-ASCII characters
-                    import re
-                    clean_msg = re.sub(r'[^\x00-\x7F]+', '', self.format(record))
+                    clean_msg = _NON_ASCII.sub('', msg)
                     self.stream.write(clean_msg + self.terminator)
                     self.flush()
                 except Exception:
@@ -100,8 +102,8 @@ def format_hours(hours: float) -> str:
     """
     Format hours to a readable string
     """
-    h = int(hours)
-    m = int((hours - h) * 60)
+    # Round to whole minutes once so e.g. 8.0 never prints as "7h 59m"
+    h, m = divmod(int(round(hours * 60)), 60)
     return f"{h}h {m}m"
 
 
@@ -128,24 +130,26 @@ def safe_print(message: str):
     try:
         print(message)
     except UnicodeEncodeError:
-        import re
-        clean = re.sub(r'[^\x00-\x7F]+', '', message)
+        clean = _NON_ASCII.sub('', message)
         print(clean)
 
 
+_IS_WIN32 = sys.platform == 'win32'
+
+# Text fallbacks for emoji the Windows console can't render
+_EMOJI_MAP = {
+    '🚀': '[START]', '⏰': '[TIME]', '📊': '[STATS]',
+    '📅': '[CALENDAR]', '🤖': '[AI]', '🔍': '[SEARCH]',
+    '✅': '[OK]', '❌': '[ERROR]', '⚠️': '[WARNING]',
+    '🛑': '[STOP]', '👋': '[BYE]', '💪': '[FORCE]',
+    '🧪': '[TEST]', '▶️': '[RUN]', '⏭️': '[SKIP]',
+    '📋': '[LIST]', '📬': '[MAIL]', '🎯': '[TARGET]',
+    '📈': '[GRAPH]', '⏱️': '[TIMER]'
+}
+
+
 def get_safe_emoji(emoji: str, fallback: str = '') -> str:
     """
     Return emoji on Unix, fallback text on Windows
     """
-    if sys.platform == 'win32':
-        emoji_map = {
-            '🚀': '[START]', '⏰': '[TIME]', '📊': '[STATS]',
-            '📅': '[CALENDAR]', '🤖': '[AI]', '🔍': '[SEARCH]',
-            '✅': '[OK]', '❌': '[ERROR]', '⚠️': '[WARNING]',
-            '🛑': '[STOP]', '👋': '[BYE]', '💪': '[FORCE]',
-            '🧪': '[TEST]', '▶️': '[RUN]', '⏭️': '[SKIP]',
-            '📋': '[LIST]', '📬': '[MAIL]', '🎯': '[TARGET]',
-            '📈': '[GRAPH]', '⏱️': '[TIMER]'
-        }
-        return emoji_map.get(emoji, fallback)
-    return emoji
+    return _EMOJI_MAP.get(emoji, fallback) if _IS_WIN32 else emoji
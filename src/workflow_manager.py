@@ -1,15 +1,75 @@
+import bisect
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Tuple, Optional, Union
 from src.teamlogger_client import TeamLoggerClient
 from src.googlesheets_Client import GoogleSheetsLeaveClient
 from src.email_service import EmailService
 from src.activity_analysis import ActivityAnalyzer
+from src.manager_mapping import get_manager_name, get_manager_email
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=2)
+def _monitoring_period_for(today_date: date) -> Tuple[datetime, datetime]:
+    """Previous Monday to Sunday for a given day; only depends on the date, so it is memoized"""
+    today = datetime(today_date.year, today_date.month, today_date.day)
+    current_monday = today - timedelta(days=today.weekday())
+    previous_monday = current_monday - timedelta(days=7)
+    previous_sunday = previous_monday + timedelta(days=6)
+
+    start_time = previous_monday
+    end_time = previous_sunday.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    return start_time, end_time
+
+
+def _normalized_name(employee: Dict) -> str:
+    """Stripped, lower-cased employee name, computed once and kept on the employee dict"""
+    name = employee.get('_name_normalized')
+    if name is None:
+        name = employee['_name_normalized'] = (employee.get('name') or '').strip().lower()
+    return name
+
+
+def _name_parts(employee: Dict) -> Tuple[str, ...]:
+    """Words longer than two letters of the normalized name, kept on the employee dict like the name itself"""
+    parts = employee.get('_name_parts')
+    if parts is None:
+        parts = employee['_name_parts'] = tuple(part for part in _normalized_name(employee).split() if len(part) > 2)
+    return parts
+
+
+@dataclass
+class EmployeeWeekRecord:
+    """Hours and leave for one active employee over the monitoring period"""
+    employee: Dict
+    excluded: bool = False
+    weekly_data: Optional[Dict] = None
+    leave_days: float = 0.0
+    required_hours: float = 0.0
+    acceptable_hours: float = 0.0
+    error: Optional[str] = None
+
+
 class WorkflowManager:
+    # Statistics buckets: hours below each edge fall in the matching key, the rest in '40h+'
+    _HOUR_EDGES = (11, 21, 31, 37, 40)
+    _HOUR_KEYS = ('0-10h', '11-20h', '21-30h', '31-37h', '37-40h', '40h+')
+    # Indexed by whole leave days, capped at 5
+    _LEAVE_KEYS = ('0_days', '1_day', '2_days', '3_days', '4_days', '5_days')
+    # Required/acceptable hours by days off (leave plus company holidays) in half-day steps
+    _REQUIRED_HOURS = {half_days / 2: max(0.0, 8.0 * (5 - half_days / 2)) for half_days in range(11)}
+    _ACCEPTABLE_HOURS = {days: max(0, hours - Config.HOURS_BUFFER) for days, hours in _REQUIRED_HOURS.items()}
+
     def __init__(self):
         self.teamlogger = TeamLoggerClient()
 
@@ -34,6 +94,16 @@ class WorkflowManager:
         self.email_service = EmailService()
         self.activity_analyzer = ActivityAnalyzer(self.teamlogger)
         self.manual_email_overrides: Dict[str, bool] = {}
+        # (employee name, period start, period end) -> (fetched_at, working-day leave count)
+        self._leave_cache: Dict[Tuple[str, object, object], Tuple[float, float]] = {}
+        # (monitoring period, fetched_at, records) from the last _collect_week_records
+        self._week_records_cache: Optional[Tuple[Tuple[datetime, datetime], float, List[EmployeeWeekRecord]]] = None
+        # (period start, period end, sheet months, employee names) -> (fetched_at, indexes of active employees)
+        self._active_cache: Dict[Tuple[object, object, Tuple[str, ...], Tuple[str, ...]], Tuple[float, List[int]]] = {}
+        # Timestamp captured once per run_workflow, so every step agrees on "now"
+        self._run_now: Optional[datetime] = None
+        # Active employee count seen by the last activity scan, reused for the workflow summary
+        self._last_active_count: Optional[int] = None
         
         # 5-day work system configuration
         self.min_hours = Config.MINIMUM_HOURS_PER_WEEK  # 40 hours
@@ -51,51 +121,54 @@ class WorkflowManager:
             'tirtharaj bhoumik': ['tirtharaj', 'bhoumik', 'tirtharaj bhoumik'],
             'vishal kumar': ['vishal', 'kumar', 'vishal kumar']
         }
+        # Every name and variation compiled into one pattern, so each check is a single regex search
+        excluded_terms = set(self.excluded_employees).union(*self.excluded_employees.values())
+        self._excluded_re = re.compile(
+            r'\b(?:' + '|'.join(re.escape(term) for term in sorted(excluded_terms, key=len, reverse=True)) + r')\b'
+        )
         
         # --- AI Client Initialization ---
-        self.openai_client = None
+        # openai is imported on first use of openai_client, not here
+        self._openai_client = None
+        self._openai_loaded = False
 
         # Log exactly what Config saw
         logger.debug(f"Config.OPENAI_API_KEY            = {bool(Config.OPENAI_API_KEY)}")
         logger.debug(f"Config.ENABLE_OPENAI_ENHANCEMENT = {Config.ENABLE_OPENAI_ENHANCEMENT}")
 
         # Only wire up OpenAI if both the key and flag are present
-        if Config.OPENAI_API_KEY and Config.ENABLE_OPENAI_ENHANCEMENT:
+        self._openai_available = bool(Config.OPENAI_API_KEY and Config.ENABLE_OPENAI_ENHANCEMENT)
+        if not self._openai_available:
+            logger.info("🤖 Skipping AI init (OPENAI_API_KEY or ENABLE_OPENAI_ENHANCEMENT missing)")
+
+    @property
+    def openai_client(self):
+        """The openai module, imported on first access; None when AI is disabled or unavailable"""
+        if self._openai_available and not self._openai_loaded:
+            self._openai_loaded = True
             try:
                 import openai
                 # ensure global key is set
                 openai.api_key = Config.OPENAI_API_KEY
                 # use the module itself as "client"
-                self.openai_client = openai
+                self._openai_client = openai
                 logger.info("🤖 OpenAI client initialized successfully")
             except Exception as e:
                 logger.warning(f"⚠️ Failed to initialize OpenAI client: {e}")
-        else:
-            logger.info("🤖 Skipping AI init (OPENAI_API_KEY or ENABLE_OPENAI_ENHANCEMENT missing)")
+        return self._openai_client
+    
+    def _is_employee_excluded(self, employee: Union[str, Dict]) -> bool:
+        """Check if employee should be excluded (case-insensitive with variations)
 
+        Accepts a name or an employee dict, whose normalized name is reused.
+        """
+        if isinstance(employee, dict):
+            name_lower = _normalized_name(employee)
+        else:
+            name_lower = employee.lower().strip()
 
-    
-    def _is_employee_excluded(self, employee_name: str) -> bool:
-        """Check if employee should be excluded (case-insensitive with variations)"""
-        name_lower = employee_name.lower().strip()
-        
-        # Check exact matches
-        for excluded_name, variations in self.excluded_employees.items():
-            if name_lower == excluded_name:
-                return True
-            
-            # Check variations
-            for variation in variations:
-                if variation in name_lower or name_lower in variation:
-                    return True
-            
-            # Check by parts (first name or last name)
-            name_parts = name_lower.split()
-            for part in name_parts:
-                if part in variations:
-                    return True
-        
-        return False
+        # Full names, variations and first/last name parts, matched on word boundaries
+        return self._excluded_re.search(name_lower) is not None
     
     def set_manual_email_overrides(self, overrides: Dict[str, bool]) -> None:
         """Update manual email overrides collected from the UI"""
@@ -106,7 +179,14 @@ class WorkflowManager:
     
     def run_workflow(self):
         """Main workflow execution - OPTIMIZED for speed and accuracy"""
-        start_time = datetime.now()
+        self._run_now = datetime.now()
+        try:
+            return self._run_workflow()
+        finally:
+            self._run_now = None
+
+    def _run_workflow(self):
+        start_time = self._run_now
         logger.info("="*60)
         logger.info("Starting Employee Hours Monitoring Workflow")
         logger.info(f"Execution time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -114,59 +194,69 @@ class WorkflowManager:
         
         # Get monitoring period
         work_week_start, work_week_end = self._get_monitoring_period()
-        logger.info(f"Monitoring period: {work_week_start.strftime('%Y-%m-%d')} to {work_week_end.strftime('%Y-%m-%d')}")
+        # Formatted once here and reused by every alert email
+        week_start_str = work_week_start.strftime('%Y-%m-%d')
+        week_end_str = work_week_end.strftime('%Y-%m-%d')
+        logger.info(f"Monitoring period: {week_start_str} to {week_end_str}")
         
-        # Get all employees in batch (faster)
-        all_employees = self.teamlogger.get_all_employees()
-
-        # Filter to only include employees who are currently in Google Sheets (active employees)
-        employees = self._filter_active_employees(all_employees, work_week_start, work_week_end)
-        total_employees = len(employees)
-        logger.info(f"Found {len(all_employees)} total employees, {total_employees} active employees in Google Sheets")
+        # Fetch hours and leave for everyone in one pass (fresh, since alerts go out)
+        records = self._collect_week_records(force_refresh=True)
+        total_employees = len(records)
         
-        if not employees:
+        if not records:
             logger.error("No employees found. Workflow cannot proceed.")
             return
         
-        # Process counters
-        processed_count = 0
-        alerts_sent = 0
-        employees_on_leave = 0
-        employees_meeting_hours = 0
-        excluded_count = 0
-        errors_count = 0
-        manual_override_skips = 0
-        
-        # Batch process employees for speed
-        for employee in employees:
+        # Outcome counts keyed on result status. Fetch failures and exceptions are
+        # tallied as 'failed'; an 'error' status (alert not delivered) is not a processing error
+        processed_count = len(records)
+        summary = Counter()
+
+        to_process = []
+        for record in records:
+            employee_name = record.employee.get('name', 'Unknown')
+            if record.excluded:
+                logger.info(f"🚫 Excluding {employee_name} from alerts")
+                summary['excluded'] += 1
+            elif record.error:
+                summary['failed'] += 1
+                logger.error(f"Error processing {employee_name}: {record.error}")
+            else:
+                to_process.append(record)
+
+        # Decide every employee first; the data is already fetched, so this needs no I/O
+        pending_alerts = []
+        for record in to_process:
             try:
-                processed_count += 1
-                employee_name = employee.get('name', 'Unknown')
-                
-                # FIXED: Check exclusion first
-                if self._is_employee_excluded(employee_name):
-                    logger.info(f"🚫 Excluding {employee_name} from alerts")
-                    excluded_count += 1
-                    continue
-                
-                # Process employee
-                result = self._process_employee_fast(employee, work_week_start, work_week_end)
-                
-                if result['status'] == 'alert_sent':
-                    alerts_sent += 1
-                elif result['status'] == 'on_full_leave':
-                    employees_on_leave += 1
-                elif result['status'] == 'hours_met':
-                    employees_meeting_hours += 1
-                elif result['status'] == 'manually_skipped':
-                    manual_override_skips += 1
-                    
+                result = self._process_employee_fast(record, week_start_str, week_end_str)
             except Exception as e:
-                errors_count += 1
-                logger.error(f"Error processing {employee.get('name', 'Unknown')}: {str(e)}")
+                summary['failed'] += 1
+                logger.error(f"Error processing {record.employee.get('name', 'Unknown')}: {str(e)}")
+                continue
+            if result['status'] == 'alert_pending':
+                pending_alerts.append(result)
+            else:
+                summary[result.get('status', 'error')] += 1
+
+        # Then send all alerts over a single SMTP session
+        if pending_alerts:
+            delivered = self.email_service.send_low_hours_alerts_bulk([result['email_data'] for result in pending_alerts])
+            for result, success in zip(pending_alerts, delivered):
+                if success:
+                    logger.info(f"📧 Alert sent to {result['employee']}")
+                    summary['alert_sent'] += 1
+                else:
+                    logger.error(f"❌ Failed to send alert to {result['employee']}")
+                    summary['error'] += 1
         
         # Summary
         execution_time = datetime.now() - start_time
+        excluded_count = summary['excluded']
+        errors_count = summary['failed']
+        alerts_sent = summary['alert_sent']
+        employees_on_leave = summary['on_full_leave']
+        employees_meeting_hours = summary['hours_met']
+        manual_override_skips = summary['manually_skipped']
         
         logger.info("="*60)
         logger.info("WORKFLOW EXECUTION SUMMARY")
@@ -194,9 +284,9 @@ class WorkflowManager:
             'execution_time': str(execution_time)
         }
     
-    def _process_employee_fast(self, employee: Dict, work_week_start: datetime, work_week_end: datetime) -> Dict:
-        """Process individual employee - FAST and ACCURATE"""
-        employee_id = employee.get('id')
+    def _process_employee_fast(self, record: EmployeeWeekRecord, week_start: str, week_end: str) -> Dict:
+        """Decide whether one employee needs an alert; alerts come back 'alert_pending' with their email data"""
+        employee = record.employee
         employee_email = employee.get('email')
         employee_name = employee.get('name', 'Employee')
 
@@ -205,25 +295,16 @@ class WorkflowManager:
             logger.info(f"🚫 Manual override: skipping alert workflow for {employee_name}")
             return {'status': 'manually_skipped', 'employee': employee_name}
         
-        # Get hours worked (Mon-Sun)
-        weekly_data = self.teamlogger.get_weekly_summary(employee_id, work_week_start, work_week_end)
+        # Hours worked (Mon-Sun)
+        weekly_data = record.weekly_data
         if not weekly_data:
             logger.warning(f"No data for {employee_name}")
             return {'status': 'no_data', 'employee': employee_name}
         
         actual_hours_worked = weekly_data['total_hours']
-
-        # FIXED: Get leave days with force refresh for real-time accuracy
-        leave_days = self._get_working_day_leaves_count_realtime(
-            employee_name, work_week_start, work_week_end
-        )
-
-        # Detect company-wide holidays in this period
-        company_holidays = self._get_company_holidays_in_period(work_week_start, work_week_end)
-
-        # Calculate requirements (including company holidays)
-        required_hours = self._calculate_required_hours(leave_days, company_holidays)
-        acceptable_hours = max(0, required_hours - Config.HOURS_BUFFER)  # 3-hour buffer
+        leave_days = record.leave_days
+        required_hours = record.required_hours
+        acceptable_hours = record.acceptable_hours  # 3-hour buffer
         
         # REMOVED: 10-minute negligible shortfall check
         # Now using only the 3-hour buffer for decisions
@@ -249,8 +330,8 @@ class WorkflowManager:
         email_data = {
             'email': employee_email,
             'name': employee_name,
-            'week_start': work_week_start.strftime('%Y-%m-%d'),
-            'week_end': work_week_end.strftime('%Y-%m-%d'),
+            'week_start': week_start,
+            'week_end': week_end,
             'total_hours': round(actual_hours_worked, 2),  # Now represents active hours (total - idle)
             'original_total_hours': round(weekly_data.get('original_total_hours', actual_hours_worked), 2),
             'idle_hours': round(weekly_data.get('idle_hours', 0), 2),
@@ -262,14 +343,80 @@ class WorkflowManager:
             'leave_days': leave_days
         }
         
-        # Send alert
-        if self.email_service.send_low_hours_alert(email_data):
-            logger.info(f"📧 Alert sent to {employee_name}")
-            return {'status': 'alert_sent', 'employee': employee_name, 'shortfall': shortfall}
-        else:
-            logger.error(f"❌ Failed to send alert to {employee_name}")
-            return {'status': 'error', 'employee': employee_name}
+        # Sent by run_workflow together with the other alerts
+        return {'status': 'alert_pending', 'employee': employee_name, 'shortfall': shortfall, 'email_data': email_data}
     
+    def _collect_week_records(self, force_refresh: bool = False) -> List[EmployeeWeekRecord]:
+        """
+        Fetch hours and leave for every active employee over the monitoring period
+
+        run_workflow, get_employees_needing_real_alerts and get_work_week_statistics
+        only differ in how they use these records, so one snapshot is shared between
+        them for Config.LEAVE_CACHE_TTL seconds.
+        """
+        work_week_start, work_week_end = self._get_monitoring_period()
+        period = (work_week_start, work_week_end)
+
+        cached = self._week_records_cache
+        if (not force_refresh and cached and cached[0] == period
+                and time.monotonic() - cached[1] < Config.LEAVE_CACHE_TTL):
+            logger.debug("📦 Using cached employee week records")
+            return cached[2]
+
+        if force_refresh:
+            # Download the leave sheets once for this pass and drop leave counts worked out from
+            # the previous download; every lookup below then reads the fresh data
+            self.clear_caches()
+
+        employees = self._get_active_employees(work_week_start, work_week_end, force_refresh=force_refresh)
+
+        excluded = [self._is_employee_excluded(e) for e in employees]
+        included = [e for e, is_excluded in zip(employees, excluded) if not is_excluded]
+
+        # Company holidays are the same for everyone - detect them once
+        company_holidays = self._get_company_holidays_in_period(work_week_start, work_week_end)
+
+        # Read the leave sheets once for everyone rather than once per employee
+        try:
+            leaves_by_employee = self.google_sheets.get_employee_leaves_bulk(
+                [employee.get('name', '') for employee in included], work_week_start, work_week_end
+            )
+        except Exception as e:
+            logger.warning(f"Bulk leave lookup failed, falling back to per-employee lookups: {str(e)}")
+            leaves_by_employee = {}
+
+        def build_record(employee: Dict, is_excluded: bool) -> EmployeeWeekRecord:
+            if is_excluded:
+                return EmployeeWeekRecord(employee, excluded=True)
+
+            employee_name = employee.get('name', '')
+            try:
+                weekly_data = self.teamlogger.get_weekly_summary(employee['id'], work_week_start, work_week_end)
+                if not weekly_data:
+                    return EmployeeWeekRecord(employee)
+
+                leave_days = self._get_working_day_leaves_count_realtime(
+                    employee_name, work_week_start, work_week_end, leaves_by_employee.get(employee_name)
+                )
+                required_hours = self._calculate_required_hours(leave_days, company_holidays)
+                return EmployeeWeekRecord(
+                    employee,
+                    weekly_data=weekly_data,
+                    leave_days=leave_days,
+                    required_hours=required_hours,
+                    acceptable_hours=self._calculate_acceptable_hours(leave_days, company_holidays)
+                )
+            except Exception as e:
+                logger.error(f"Error checking {employee_name or 'Unknown'}: {str(e)}")
+                return EmployeeWeekRecord(employee, error=str(e))
+
+        # TeamLogger and Sheets lookups are I/O-bound, so overlap them (map keeps the order)
+        with ThreadPoolExecutor(max_workers=Config.WORKFLOW_PARALLELISM) as executor:
+            records = list(executor.map(build_record, employees, excluded))
+
+        self._week_records_cache = (period, time.monotonic(), records)
+        return records
+
     def _get_company_holidays_in_period(self, start_date: datetime, end_date: datetime) -> int:
         """
         Detect company-wide holidays in the given period by checking the sheet directly.
@@ -354,26 +501,56 @@ class WorkflowManager:
         - Individual leave days: reduce by 8 hours per day
         - Company holidays: reduce by 8 hours per day for everyone
         """
-        # Start with 5 working days
-        total_working_days = 5
-
-        # Subtract company-wide holidays (affects everyone)
-        total_working_days -= company_holidays
-
-        # Subtract individual leave days
-        total_working_days -= leave_days
-
-        # Can't go below 0
-        if total_working_days <= 0:
-            return 0.0
-
-        return 8.0 * total_working_days
+        days_off = company_holidays + leave_days
+        required_hours = self._REQUIRED_HOURS.get(days_off)
+        if required_hours is None:
+            # Off the half-day grid or beyond a full week - can't go below 0
+            required_hours = max(0.0, 8.0 * (5 - days_off))
+        return required_hours
+
+    def _calculate_acceptable_hours(self, leave_days: float, company_holidays: int = 0) -> float:
+        """Required hours less the flexibility buffer, never below 0"""
+        acceptable_hours = self._ACCEPTABLE_HOURS.get(company_holidays + leave_days)
+        if acceptable_hours is None:
+            acceptable_hours = max(0, self._calculate_required_hours(leave_days, company_holidays) - Config.HOURS_BUFFER)
+        return acceptable_hours
     
-    def _get_working_day_leaves_count_realtime(self, employee_name: str, start_date: datetime, end_date: datetime) -> float:
-        """Get leave count with real-time accuracy (using cache to avoid rate limits)"""
+    def clear_caches(self) -> None:
+        """Drop cached week records, active employee lists, leave counts, leave sheets and
+        TeamLogger summary reports so the next lookup reads TeamLogger and Google Sheets again"""
+        self._week_records_cache = None
+        self._active_cache.clear()
+        self._leave_cache.clear()
+        if hasattr(self.google_sheets, 'clear_cache'):
+            self.google_sheets.clear_cache()
+        if hasattr(self.teamlogger, 'clear_cache'):
+            self.teamlogger.clear_cache()
+
+    def invalidate_employee(self, employee_name: str) -> None:
+        """Drop cached leave counts for an employee so the next lookup re-reads Google Sheets"""
+        name_key = employee_name.strip().lower()
+        for key in [key for key in self._leave_cache if key[0] == name_key]:
+            self._leave_cache.pop(key, None)
+
+    def _get_working_day_leaves_count_realtime(self, employee_name: str, start_date: datetime, end_date: datetime,
+                                               leaves: Optional[List[Dict]] = None) -> float:
+        """Get leave count with real-time accuracy (using cache to avoid rate limits)
+
+        Pass leaves when they were already fetched (e.g. in bulk) to skip the Sheets lookup;
+        the count is then always computed from them rather than served from the cache.
+        """
+        cache_key = (employee_name.strip().lower(), start_date.date(), end_date.date())
+        if leaves is None:
+            # Reuse a recent count for the same employee and period (see Config.LEAVE_CACHE_TTL)
+            cached = self._leave_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < Config.LEAVE_CACHE_TTL:
+                logger.debug(f"📦 Using cached leave count for {employee_name}")
+                return cached[1]
+
         try:
             # Use cache to avoid rate limits - data is fresh enough for the session
-            leaves = self.google_sheets.get_employee_leaves(employee_name, start_date, end_date, force_refresh=False)
+            if leaves is None:
+                leaves = self.google_sheets.get_employee_leaves(employee_name, start_date, end_date, force_refresh=False)
             
             working_day_leave_count = 0.0
             
@@ -386,14 +563,16 @@ class WorkflowManager:
                     if leave.get('is_half_day', False) or leave.get('days_count', 1) == 0.5:
                         working_day_leave_count += 0.5
                     else:
-                        # Count only working days (Mon-Fri)
-                        current = leave_start
-                        while current <= leave_end:
-                            if current.weekday() < 5:  # Monday=0, Friday=4
-                                working_day_leave_count += 1
-                            current += timedelta(days=1)
+                        # Count only working days (Mon-Fri): 5 per full week, then check the remainder
+                        days = (leave_end - leave_start).days + 1
+                        full_weeks, remainder = divmod(days, 7)
+                        start_weekday = leave_start.weekday()
+                        working_day_leave_count += full_weeks * 5 + sum(
+                            1 for i in range(remainder) if (start_weekday + i) % 7 < 5  # Monday=0, Friday=4
+                        )
             
             logger.info(f"📊 {employee_name}: {working_day_leave_count} leave days (real-time)")
+            self._leave_cache[cache_key] = (time.monotonic(), working_day_leave_count)
             return working_day_leave_count
             
         except Exception as e:
@@ -402,15 +581,8 @@ class WorkflowManager:
     
     def _get_monitoring_period(self) -> Tuple[datetime, datetime]:
         """Get the monitoring period (previous Monday to Sunday)"""
-        today = datetime.now()
-        current_monday = today - timedelta(days=today.weekday())
-        previous_monday = current_monday - timedelta(days=7)
-        previous_sunday = previous_monday + timedelta(days=6)
-        
-        start_time = previous_monday.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_time = previous_sunday.replace(hour=23, minute=59, second=59, microsecond=999999)
-        
-        return start_time, end_time
+        now = self._run_now or datetime.now()
+        return _monitoring_period_for(now.date())
     
     def _get_working_day_leaves_count(self, employee_name: str, start_date: datetime, end_date: datetime) -> float:
         """Get count of approved leave days that fall on working days (Monday-Friday) only"""
@@ -431,14 +603,35 @@ class WorkflowManager:
             logger.error(f"Error calculating working day leaves for {employee_name}: {str(e)}")
             return 0.0
 
-    def _filter_active_employees(self, employees: List[Dict], start_date: datetime, end_date: datetime) -> List[Dict]:
+    def _get_active_employees(self, start_date: datetime, end_date: datetime,
+                              force_refresh: bool = False) -> List[Dict]:
+        """TeamLogger employees who are active in Google Sheets, shared by every workflow entry point"""
+        # The summary report behind get_all_employees and the active filter are both cached per period
+        all_employees = self.teamlogger.get_all_employees()
+        employees = self._filter_active_employees(all_employees, start_date, end_date, force_refresh=force_refresh)
+        logger.info(f"Found {len(all_employees)} total employees, {len(employees)} active employees in Google Sheets")
+        return employees
+
+    def _filter_active_employees(self, employees: List[Dict], start_date: datetime, end_date: datetime,
+                                 force_refresh: bool = False) -> List[Dict]:
         """Filter employees to only include those who are currently in Google Sheets (active employees)
 
         Known inactive employees (left organization):
         - Priya Bhadauria, aishik chatterjee, Ashique Mohammed C, Aayush Limbbad
         - Kajol Jaiswal, Tirtharaj Bhowmik, Neeraj Deshpande, Arsh Sohal
         """
+        # The period can straddle two months, so check every month it touches plus the current one
+        now = self._run_now or datetime.now()
+        month_sheets = tuple(dict.fromkeys(d.strftime("%b %y") for d in (start_date, end_date, now)))  # "Sep 25" format
+        cache_key = (start_date.date(), end_date.date(), month_sheets,
+                     tuple(_normalized_name(employee) for employee in employees))
+        cached = self._active_cache.get(cache_key)
+        if not force_refresh and cached and time.monotonic() - cached[0] < Config.LEAVE_CACHE_TTL:
+            logger.debug(f"📦 Using cached active employee list ({len(cached[1])} of {len(employees)})")
+            return [employees[index] for index in cached[1]]
+
         active_employees = []
+        active_indexes = []
 
         # Known inactive employees who have left the organization
         KNOWN_INACTIVE_EMPLOYEES = {
@@ -449,111 +642,94 @@ class WorkflowManager:
 
         logger.info(f"Filtering {len(employees)} employees to find active ones in Google Sheets...")
 
-        for employee in employees:
+        # Fetch each month's sheet once and normalise the combined name column up front
+        sheet_names = None
+        try:
+            names = set()
+            for month_sheet in month_sheets:
+                # Use cache to avoid rate limits (force_refresh=False)
+                sheet_data = self.google_sheets._fetch_sheet_data(month_sheet, force_refresh=False)
+                names.update(str(row[0]).strip().lower() for row in sheet_data or [] if row and len(row) > 0)
+            sheet_names = names
+            # Names never contain newlines, so one substring test here covers every sheet name at once
+            sheet_names_joined = '\n'.join(sheet_names)
+        except Exception as e:
+            logger.warning(f"Error fetching Google Sheets for active employee check: {str(e)}")
+
+        for index, employee in enumerate(employees):
             employee_name = employee.get('name', '')
             if not employee_name:
                 continue
 
             # Quick check against known inactive employees
-            employee_name_lower = employee_name.strip().lower()
+            employee_name_lower = _normalized_name(employee)
             if employee_name_lower in KNOWN_INACTIVE_EMPLOYEES:
                 logger.info(f"❌ {employee_name} - Known inactive employee (left organization)")
                 continue
 
-            try:
-                # Try to get leave data for this employee from Google Sheets
-                # If the employee is not in the sheet, this will return empty or fail
-                # Use cache to avoid rate limits (force_refresh=False)
-                leaves = self.google_sheets.get_employee_leaves(employee_name, start_date, end_date, force_refresh=False)
-
-                # Check if we can find this employee in the current month's sheet
-                current_month_sheet = datetime.now().strftime("%b %y")  # Use "Sep 25" format
-                # Use cache to avoid rate limits (force_refresh=False)
-                sheet_data = self.google_sheets._fetch_sheet_data(current_month_sheet, force_refresh=False)
-
-                employee_found_in_sheet = False
-                if sheet_data:
-                    for row in sheet_data:
-                        if row and len(row) > 0:
-                            cell_name = str(row[0]).strip().lower()
-                            # Multiple matching strategies
-                            if (employee_name_lower == cell_name or
-                                employee_name_lower in cell_name or
-                                cell_name in employee_name_lower or
-                                # Check if main parts of names match
-                                any(part in cell_name for part in employee_name_lower.split() if len(part) > 2)):
-                                employee_found_in_sheet = True
-                                break
-
-                if employee_found_in_sheet:
-                    active_employees.append(employee)
-                    logger.debug(f"✅ {employee_name} - Found in Google Sheets (active)")
-                else:
-                    logger.info(f"🚫 {employee_name} - Not found in Google Sheets, skipping from monitoring list")
-
-            except Exception as e:
-                logger.warning(f"Error checking {employee_name} in Google Sheets: {str(e)}")
+            if sheet_names is None:
                 # If there's an error (e.g., rate limit), INCLUDE the employee to avoid false negatives
                 # Better to send an alert to an active employee than miss someone who needs it
                 active_employees.append(employee)
                 logger.info(f"⚠️ {employee_name} - Included despite error (safer to include)")
+                continue
+
+            # Exact match is a set lookup; fall back to the looser matching strategies
+            employee_found_in_sheet = employee_name_lower in sheet_names
+            if not employee_found_in_sheet and sheet_names:
+                name_parts = _name_parts(employee)
+                employee_found_in_sheet = (
+                    employee_name_lower in sheet_names_joined or
+                    # Check if main parts of names match
+                    any(part in sheet_names_joined for part in name_parts) or
+                    any(cell_name in employee_name_lower for cell_name in sheet_names)
+                )
+
+            if employee_found_in_sheet:
+                active_employees.append(employee)
+                active_indexes.append(index)
+                logger.debug(f"✅ {employee_name} - Found in Google Sheets (active)")
+            else:
+                logger.info(f"🚫 {employee_name} - Not found in Google Sheets, skipping from monitoring list")
 
         logger.info(f"Filtered to {len(active_employees)} active employees (removed {len(employees) - len(active_employees)} who left)")
+
+        # Only a result checked against the sheet is worth reusing; after a fetch error, retry next time
+        if sheet_names is not None:
+            now = time.monotonic()
+            self._active_cache = {key: entry for key, entry in self._active_cache.items()
+                                  if now - entry[0] < Config.LEAVE_CACHE_TTL}
+            self._active_cache[cache_key] = (now, active_indexes)
         return active_employees
 
     def get_employees_needing_real_alerts(self) -> List[Dict]:
         """Get list of employees who would receive alerts - ACCURATE VERSION"""
-        work_week_start, work_week_end = self._get_monitoring_period()
-        employees = self.teamlogger.get_all_employees()
-
-        # Filter out employees who are no longer in Google Sheets (left the organization)
-        active_employees = self._filter_active_employees(employees, work_week_start, work_week_end)
         employees_needing_alerts = []
 
-        for employee in active_employees:
-            try:
-                employee_name = employee.get('name', '')
-                
-                # FIXED: Skip excluded employees
-                if self._is_employee_excluded(employee_name):
-                    logger.debug(f"Skipping excluded employee: {employee_name}")
-                    continue
-                
-                weekly_data = self.teamlogger.get_weekly_summary(employee['id'], work_week_start, work_week_end)
-                if not weekly_data:
-                    continue
-                
-                # Get real-time leave data
-                leave_days = self._get_working_day_leaves_count_realtime(
-                    employee_name, work_week_start, work_week_end
-                )
-
-                # Detect company holidays (cached per monitoring run)
-                if not hasattr(self, '_cached_company_holidays'):
-                    self._cached_company_holidays = self._get_company_holidays_in_period(work_week_start, work_week_end)
-                company_holidays = self._cached_company_holidays
+        for record in self._collect_week_records():
+            # FIXED: Skip excluded employees
+            if record.excluded:
+                logger.debug(f"Skipping excluded employee: {record.employee.get('name', '')}")
+                continue
+            if not record.weekly_data:
+                continue
 
-                actual_hours = weekly_data['total_hours']
-                required_hours = self._calculate_required_hours(leave_days, company_holidays)
-                acceptable_hours = max(0, required_hours - Config.HOURS_BUFFER)
+            actual_hours = record.weekly_data['total_hours']
+            
+            # Simple check - no AI complications
+            if actual_hours < record.acceptable_hours and record.leave_days < 5:
+                shortfall = record.required_hours - actual_hours
                 
-                # Simple check - no AI complications
-                if actual_hours < acceptable_hours and leave_days < 5:
-                    shortfall = required_hours - actual_hours
-                    
-                    employees_needing_alerts.append({
-                        'employee': employee,
-                        'weekly_data': weekly_data,
-                        'leave_days': leave_days,
-                        'required_hours': required_hours,
-                        'acceptable_hours': acceptable_hours,
-                        'shortfall': shortfall,
-                        'shortfall_minutes': int(shortfall * 60),
-                        'working_days': 5 - leave_days
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error checking {employee.get('name', 'Unknown')}: {str(e)}")
+                employees_needing_alerts.append({
+                    'employee': record.employee,
+                    'weekly_data': record.weekly_data,
+                    'leave_days': record.leave_days,
+                    'required_hours': record.required_hours,
+                    'acceptable_hours': record.acceptable_hours,
+                    'shortfall': shortfall,
+                    'shortfall_minutes': int(shortfall * 60),
+                    'working_days': 5 - record.leave_days
+                })
         
         return employees_needing_alerts
 
@@ -574,7 +750,7 @@ class WorkflowManager:
             return {
                 'preview_mode': True,
                 'alerts_would_be_sent': 0,
-                'employees_checked': len(self._filter_active_employees(self.teamlogger.get_all_employees(), work_week_start, work_week_end))
+                'employees_checked': len(self._collect_week_records())
             }
 
         logger.info(f"📧 {len(employees_needing_alerts)} employees would receive alerts:")
@@ -609,13 +785,14 @@ class WorkflowManager:
             'employee_details': employees_needing_alerts
         }
 
-    def should_send_alerts_today(self) -> bool:
+    def should_send_alerts_today(self, now: Optional[datetime] = None) -> bool:
         """Check if today is Monday or Tuesday"""
-        return datetime.now().weekday() in [0, 1]
+        now = now or self._run_now or datetime.now()
+        return now.weekday() in [0, 1]
     
-    def is_optimal_execution_time(self) -> bool:
+    def is_optimal_execution_time(self, now: Optional[datetime] = None) -> bool:
         """Check if current time is optimal for sending alerts (Monday 8 AM)"""
-        now = datetime.now()
+        now = now or self._run_now or datetime.now()
         return (now.weekday() == Config.EXECUTION_DAY and now.hour == Config.EXECUTION_HOUR)
     
     def get_week_boundaries(self) -> Tuple[datetime, datetime]:
@@ -626,10 +803,7 @@ class WorkflowManager:
         """Get comprehensive statistics for the work week"""
         try:
             work_week_start, work_week_end = self._get_monitoring_period()
-            all_employees = self.teamlogger.get_all_employees()
-
-            # Filter to only include active employees (those in Google Sheets)
-            employees = self._filter_active_employees(all_employees, work_week_start, work_week_end)
+            records = self._collect_week_records()
             
             stats = {
                 'period': {
@@ -638,7 +812,7 @@ class WorkflowManager:
                     'type': '5-Day Work System'
                 },
                 'totals': {
-                    'employees': len(employees),
+                    'employees': len(records),
                     'alerts_needed': 0,
                     'on_full_leave': 0,
                     'meeting_requirements': 0,
@@ -653,61 +827,41 @@ class WorkflowManager:
                     '3_days': 0, '4_days': 0, '5_days': 0
                 }
             }
+            totals = stats['totals']
+            hour_distribution = stats['hour_distribution']
+            leave_distribution = stats['leave_distribution']
             
-            for employee in employees:
+            # One pass over the records, updating every counter as we go
+            for record in records:
                 try:
-                    if self._is_employee_excluded(employee['name']):
-                        stats['totals']['excluded_employees'] += 1
+                    if record.excluded:
+                        totals['excluded_employees'] += 1
                         continue
                     
-                    weekly_data = self.teamlogger.get_weekly_summary(
-                        employee['id'], work_week_start, work_week_end
-                    )
+                    weekly_data = record.weekly_data
                     if not weekly_data:
                         continue
                     
-                    leave_days = self._get_working_day_leaves_count_realtime(
-                        employee['name'], work_week_start, work_week_end
-                    )
-
-                    # Use cached company holidays
-                    if not hasattr(self, '_cached_company_holidays'):
-                        self._cached_company_holidays = self._get_company_holidays_in_period(work_week_start, work_week_end)
-                    company_holidays = self._cached_company_holidays
-
+                    leave_days = record.leave_days
                     hours = weekly_data['total_hours']
-                    required_hours = self._calculate_required_hours(leave_days, company_holidays)
-                    acceptable_hours = max(0, required_hours - Config.HOURS_BUFFER)
+                    acceptable_hours = record.acceptable_hours
                     
                     # Categorize
                     if leave_days >= 5:
-                        stats['totals']['on_full_leave'] += 1
+                        totals['on_full_leave'] += 1
                     elif hours < acceptable_hours:
-                        stats['totals']['alerts_needed'] += 1
+                        totals['alerts_needed'] += 1
                     else:
-                        stats['totals']['meeting_requirements'] += 1
+                        totals['meeting_requirements'] += 1
                     
                     # Hour distribution
-                    if hours < 11:
-                        stats['hour_distribution']['0-10h'] += 1
-                    elif hours < 21:
-                        stats['hour_distribution']['11-20h'] += 1
-                    elif hours < 31:
-                        stats['hour_distribution']['21-30h'] += 1
-                    elif hours < 37:
-                        stats['hour_distribution']['31-37h'] += 1
-                    elif hours < 40:
-                        stats['hour_distribution']['37-40h'] += 1
-                    else:
-                        stats['hour_distribution']['40h+'] += 1
+                    hour_distribution[self._HOUR_KEYS[bisect.bisect_right(self._HOUR_EDGES, hours)]] += 1
                     
                     # Leave distribution
-                    leave_key = f'{min(int(leave_days), 5)}_day{"s" if leave_days != 1 else ""}'
-                    if leave_key in stats['leave_distribution']:
-                        stats['leave_distribution'][leave_key] += 1
+                    leave_distribution[self._LEAVE_KEYS[min(int(leave_days), 5)]] += 1
                     
                 except Exception as e:
-                    logger.error(f"Error processing statistics for {employee.get('name', 'Unknown')}: {str(e)}")
+                    logger.error(f"Error processing statistics for {record.employee.get('name', 'Unknown')}: {str(e)}")
                     continue
             
             return stats
@@ -727,25 +881,20 @@ class WorkflowManager:
             work_week_start, work_week_end = self._get_monitoring_period()
             logger.info(f"Checking activity levels for period: {work_week_start.date()} to {work_week_end.date()}")
 
-            all_employees = self.teamlogger.get_all_employees()
-            # Filter to only include active employees (those in Google Sheets)
-            employees = self._filter_active_employees(all_employees, work_week_start, work_week_end)
+            # Active employees (those in Google Sheets); excluded ones never get alerts
+            active_employees = self._get_active_employees(work_week_start, work_week_end)
+            self._last_active_count = len(active_employees)
+            employees = [e for e in active_employees if not self._is_employee_excluded(e)]
             employees_needing_alerts = []
+            low_activity = []
 
             for employee in employees:
                 try:
                     employee_name = employee.get('name', 'Unknown')
-                    employee_id = employee.get('id')
-                    employee_email = employee.get('email', '')
-
-                    # Skip excluded employees
-                    if self._is_employee_excluded(employee_name):
-                        logger.debug(f"Skipping excluded employee: {employee_name}")
-                        continue
 
                     # Get activity report for the employee
                     activity_report = self.teamlogger.generate_employee_activity_report(
-                        employee_id, work_week_start, work_week_end
+                        employee.get('id'), work_week_start, work_week_end
                     )
 
                     if not activity_report:
@@ -756,41 +905,7 @@ class WorkflowManager:
                     activity_percentage = activity_report.overall_average_activity
 
                     if activity_percentage < self.activity_threshold:
-                        # Get manager information
-                        manager_name = self._get_manager_name(employee_name)
-                        manager_email = self._get_manager_email(employee_name)
-
-                        # Get leave days for context
-                        leave_days = self._get_working_day_leaves_count_realtime(
-                            employee_name, work_week_start, work_week_end
-                        )
-
-                        # Get hours worked for context
-                        weekly_data = self.teamlogger.get_weekly_summary(employee_id, work_week_start, work_week_end)
-                        hours_worked = weekly_data['total_hours'] if weekly_data else 0
-
-                        employee_alert_data = {
-                            'id': employee_id,
-                            'name': employee_name,
-                            'email': employee_email,
-                            'activity_percentage': round(activity_percentage, 2),
-                            'activity_threshold': self.activity_threshold,
-                            'activity_shortfall': round(self.activity_threshold - activity_percentage, 2),
-                            'hours_worked': hours_worked,
-                            'leave_days': leave_days,
-                            'manager_name': manager_name,
-                            'manager_email': manager_email,
-                            'activity_trend': activity_report.activity_trend,
-                            'low_productivity_periods': activity_report.total_low_productivity_periods,
-                            'high_productivity_periods': activity_report.total_high_productivity_periods,
-                            'most_productive_day': activity_report.most_productive_day.strftime('%A') if activity_report.most_productive_day else 'N/A',
-                            'least_productive_day': activity_report.least_productive_day.strftime('%A') if activity_report.least_productive_day else 'N/A',
-                            'period_start': work_week_start.strftime('%Y-%m-%d'),
-                            'period_end': work_week_end.strftime('%Y-%m-%d')
-                        }
-
-                        employees_needing_alerts.append(employee_alert_data)
-                        logger.info(f"🔴 {employee_name}: {activity_percentage:.1f}% activity (below {self.activity_threshold}% threshold)")
+                        low_activity.append((employee, activity_report))
                     else:
                         logger.debug(f"✅ {employee_name}: {activity_percentage:.1f}% activity (above threshold)")
 
@@ -798,6 +913,65 @@ class WorkflowManager:
                     logger.error(f"Error processing activity for {employee.get('name', 'Unknown')}: {e}")
                     continue
 
+            # Leave context for everyone below threshold comes from a single sheet pass
+            leaves_by_employee = {}
+            if low_activity:
+                try:
+                    leaves_by_employee = self.google_sheets.get_employee_leaves_bulk(
+                        [employee.get('name', 'Unknown') for employee, _ in low_activity], work_week_start, work_week_end
+                    )
+                except Exception as e:
+                    logger.warning(f"Bulk leave fetch failed, falling back to per-employee lookups: {e}")
+
+            period_start = work_week_start.strftime('%Y-%m-%d')
+            period_end = work_week_end.strftime('%Y-%m-%d')
+            for employee, activity_report in low_activity:
+                try:
+                    employee_name = employee.get('name', 'Unknown')
+                    employee_id = employee.get('id')
+                    employee_email = employee.get('email', '')
+                    activity_percentage = activity_report.overall_average_activity
+
+                    # Get manager information
+                    manager_name = self._get_manager_name(employee_name)
+                    manager_email = self._get_manager_email(employee_name)
+
+                    # Get leave days for context
+                    leave_days = self._get_working_day_leaves_count_realtime(
+                        employee_name, work_week_start, work_week_end, leaves_by_employee.get(employee_name)
+                    )
+
+                    # Get hours worked for context
+                    weekly_data = self.teamlogger.get_weekly_summary(employee_id, work_week_start, work_week_end)
+                    hours_worked = weekly_data['total_hours'] if weekly_data else 0
+
+                    employee_alert_data = {
+                        'id': employee_id,
+                        'name': employee_name,
+                        'email': employee_email,
+                        'activity_percentage': round(activity_percentage, 2),
+                        'activity_threshold': self.activity_threshold,
+                        'activity_shortfall': round(self.activity_threshold - activity_percentage, 2),
+                        'hours_worked': hours_worked,
+                        'leave_days': leave_days,
+                        'manager_name': manager_name,
+                        'manager_email': manager_email,
+                        'activity_trend': activity_report.activity_trend,
+                        'low_productivity_periods': activity_report.total_low_productivity_periods,
+                        'high_productivity_periods': activity_report.total_high_productivity_periods,
+                        'most_productive_day': activity_report.most_productive_day.strftime('%A') if activity_report.most_productive_day else 'N/A',
+                        'least_productive_day': activity_report.least_productive_day.strftime('%A') if activity_report.least_productive_day else 'N/A',
+                        'period_start': period_start,
+                        'period_end': period_end
+                    }
+
+                    employees_needing_alerts.append(employee_alert_data)
+                    logger.info(f"🔴 {employee_name}: {activity_percentage:.1f}% activity (below {self.activity_threshold}% threshold)")
+
+                except Exception as e:
+                    logger.error(f"Error processing activity for {employee.get('name', 'Unknown')}: {e}")
+                    continue
+
             logger.info(f"Found {len(employees_needing_alerts)} employees needing activity alerts")
             return employees_needing_alerts
 
@@ -818,12 +992,16 @@ class WorkflowManager:
         logger.info(f"Activity monitoring period: {work_week_start.strftime('%Y-%m-%d')} to {work_week_end.strftime('%Y-%m-%d')}")
 
         # Get employees needing activity alerts
+        self._last_active_count = None
         employees_needing_alerts = self.get_employees_needing_activity_alerts()
 
         if not employees_needing_alerts:
             logger.info("✅ No employees need activity alerts - all above 50% threshold!")
+            active_count = self._last_active_count
+            if active_count is None:
+                active_count = len(self._get_active_employees(work_week_start, work_week_end))
             return {
-                'total_employees_checked': len(self._filter_active_employees(self.teamlogger.get_all_employees(), work_week_start, work_week_end)),
+                'total_employees_checked': active_count,
                 'activity_alerts_sent': 0,
                 'activity_errors': 0,
                 'execution_time': str(datetime.now() - start_time)
@@ -833,18 +1011,19 @@ class WorkflowManager:
         alerts_sent = 0
         errors_count = 0
 
-        for employee_data in employees_needing_alerts:
-            try:
-                if self.email_service.send_low_activity_alert(employee_data):
-                    alerts_sent += 1
-                    logger.info(f"📧 Activity alert sent to {employee_data['name']}")
-                else:
-                    errors_count += 1
-                    logger.error(f"❌ Failed to send activity alert to {employee_data['name']}")
-
-            except Exception as e:
+        try:
+            results = self.email_service.send_low_activity_alerts_bulk(employees_needing_alerts)
+        except Exception as e:
+            logger.error(f"Error sending activity alerts: {e}")
+            results = [False] * len(employees_needing_alerts)
+
+        for employee_data, success in zip(employees_needing_alerts, results):
+            if success:
+                alerts_sent += 1
+                logger.info(f"📧 Activity alert sent to {employee_data['name']}")
+            else:
                 errors_count += 1
-                logger.error(f"Error sending activity alert to {employee_data.get('name', 'Unknown')}: {e}")
+                logger.error(f"❌ Failed to send activity alert to {employee_data['name']}")
 
         # Summary
         execution_time = datetime.now() - start_time
@@ -868,7 +1047,6 @@ class WorkflowManager:
     def _get_manager_name(self, employee_name: str) -> str:
         """Get manager name for an employee"""
         try:
-            from src.manager_mapping import get_manager_name
             return get_manager_name(employee_name) or "Not Assigned"
         except Exception as e:
             logger.error(f"Error getting manager name for {employee_name}: {e}")
@@ -877,7 +1055,6 @@ class WorkflowManager:
     def _get_manager_email(self, employee_name: str) -> str:
         """Get manager email for an employee"""
         try:
-            from src.manager_mapping import get_manager_email
             return get_manager_email(employee_name) or "Not Available"
         except Exception as e:
             logger.error(f"Error getting manager email for {employee_name}: {e}")
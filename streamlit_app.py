@@ -5,11 +5,9 @@ Main application entry point with AI intelligence and corrected hours display
 
 import streamlit as st
 import os
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 import logging
 from dotenv import load_dotenv
@@ -57,9 +55,13 @@ from src.teamlogger_client import TeamLoggerClient
 from src.googlesheets_Client import GoogleSheetsLeaveClient
 from src.email_service import EmailService
 
-# Initialize session state
-if 'workflow_manager' not in st.session_state:
-    st.session_state.workflow_manager = WorkflowManager()
+@st.cache_resource(show_spinner=False)
+def get_workflow_manager():
+    """One read-only WorkflowManager shared by every dashboard session in the process"""
+    return WorkflowManager()
+
+# Initialize session state. The workflow manager is deliberately not kept here:
+# pages that change per-user state (manual overrides) build their own session copy
 if 'last_refresh' not in st.session_state:
     st.session_state.last_refresh = datetime.now()
 if 'system_status' not in st.session_state:
@@ -89,6 +91,94 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource(show_spinner=False)
+def get_clients():
+    """Create the Google Sheets and email clients used for status probes once per process"""
+    return GoogleSheetsLeaveClient(), EmailService()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def probe_connections() -> Dict:
+    """Live TeamLogger, Google Sheets and SMTP checks, reused across reruns for 30 seconds"""
+    sheets, email = get_clients()
+    # A fresh TeamLogger client per probe, so its report cache doesn't live as long as the
+    # process; it still reuses the shared pooled HTTP session
+    teamlogger = TeamLoggerClient()
+    
+    # The three checks are independent network calls, so run them side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        api_future = executor.submit(teamlogger.get_api_status)
+        sheets_future = executor.submit(sheets.validate_google_sheets_connection)
+        email_future = executor.submit(email.test_email_configuration)
+    
+    # Check TeamLogger
+    try:
+        api_status = api_future.result()
+    except Exception as e:
+        logger.error(f"TeamLogger status check failed: {e}")
+        api_status = {}
+    
+    # Check Google Sheets
+    try:
+        sheets_status = sheets_future.result()
+    except Exception as e:
+        logger.error(f"Google Sheets status check failed: {e}")
+        sheets_status = {}
+    
+    # Check Email Service
+    try:
+        email_ok = email_future.result()
+    except Exception as e:
+        logger.error(f"Email status check failed: {e}")
+        email_ok = False
+    
+    return {
+        'teamlogger': api_status.get('connected', False),
+        'employee_count': api_status.get('employee_count', 0),
+        'google_sheets': sheets_status.get('status') == 'success',
+        'email': email_ok
+    }
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_week_statistics(period_start: str, period_end: str) -> Dict:
+    """Work week statistics for the given monitoring period, reused across reruns for 5 minutes"""
+    return get_workflow_manager().get_work_week_statistics()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_real_alerts(period_start: str, period_end: str) -> List[Dict]:
+    """Employees needing alerts for the given monitoring period, reused across reruns for 5 minutes"""
+    return get_workflow_manager().get_employees_needing_real_alerts()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def scheduling_snapshot(minute_key: str) -> Dict:
+    """Alert day, optimal time and next run for the given minute, shared across reruns"""
+    workflow = get_workflow_manager()
+    now = datetime.now()
+    
+    # Calculate next run time
+    days_until_monday = (7 - now.weekday()) % 7
+    if days_until_monday == 0 and now.hour >= 8:
+        days_until_monday = 7
+    next_monday = now + timedelta(days=days_until_monday)
+    
+    return {
+        'is_alert_day': workflow.should_send_alerts_today(now),
+        'is_optimal_time': workflow.is_optimal_execution_time(now),
+        'next_run': next_monday.replace(hour=8, minute=0, second=0, microsecond=0)
+    }
+
+def get_ai_state() -> Dict:
+    """AI intelligence status, worked out once per rerun for the status row, banner and sidebar"""
+    workflow = get_workflow_manager()
+    has_client = getattr(workflow, 'openai_client', None) is not None
+    has_key = bool(Config.OPENAI_API_KEY)
+    flag_on = Config.ENABLE_OPENAI_ENHANCEMENT
+    return {
+        'enabled': has_client and flag_on and has_key,
+        'has_client': has_client,
+        'has_key': has_key,
+        'flag_on': flag_on
+    }
+
 def get_system_status():
     """Get current system status and connectivity including AI status"""
     status = {
@@ -102,50 +192,21 @@ def get_system_status():
     }
     
     try:
-        # Check TeamLogger
-        teamlogger = TeamLoggerClient()
-        api_status = teamlogger.get_api_status()
-        status['teamlogger'] = api_status.get('connected', False)
-        status['employee_count'] = api_status.get('employee_count', 0)
-        
-        # Check Google Sheets
-        sheets = GoogleSheetsLeaveClient()
-        sheets_status = sheets.validate_google_sheets_connection()
-        status['google_sheets'] = sheets_status.get('status') == 'success'
-        
-        # Check Email Service
-        email = EmailService()
-        status['email'] = email.test_email_configuration()
-        
-        # Check AI Intelligence - Updated check
-        workflow = st.session_state.workflow_manager
-        # Check if OpenAI is actually configured in the workflow manager
-        status['ai_intelligence'] = (
-            hasattr(workflow, 'openai_client') and 
-            workflow.openai_client is not None and
-            Config.ENABLE_OPENAI_ENHANCEMENT and
-            bool(Config.OPENAI_API_KEY)
-        )
+        # Connectivity probes are cached, so reruns inside the TTL skip the network round trips
+        status.update(probe_connections())
         
-        # Debug logging
-        logger.info(f"AI Intelligence Status Check:")
-        logger.info(f"  - Has openai_client: {hasattr(workflow, 'openai_client')}")
-        logger.info(f"  - openai_client is not None: {hasattr(workflow, 'openai_client') and workflow.openai_client is not None}")
-        logger.info(f"  - ENABLE_OPENAI_ENHANCEMENT: {Config.ENABLE_OPENAI_ENHANCEMENT}")
-        logger.info(f"  - Has API Key: {bool(Config.OPENAI_API_KEY)}")
-        logger.info(f"  - Final AI status: {status['ai_intelligence']}")
+        # Check AI Intelligence
+        status['ai_intelligence'] = AI_STATE['enabled']
         
-        # Check scheduling
-        status['is_alert_day'] = workflow.should_send_alerts_today()
-        status['is_optimal_time'] = workflow.is_optimal_execution_time()
+        # Debug logging - this runs on every rerun, so keep it out of the INFO log
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "AI Intelligence Status Check: has_client=%s, ENABLE_OPENAI_ENHANCEMENT=%s, has_key=%s, final=%s",
+                AI_STATE['has_client'], AI_STATE['flag_on'], AI_STATE['has_key'], status['ai_intelligence']
+            )
         
-        # Calculate next run time
-        now = datetime.now()
-        days_until_monday = (7 - now.weekday()) % 7
-        if days_until_monday == 0 and now.hour >= 8:
-            days_until_monday = 7
-        next_monday = now + timedelta(days=days_until_monday)
-        status['next_run'] = next_monday.replace(hour=8, minute=0, second=0, microsecond=0)
+        # Check scheduling - only changes from one minute to the next
+        status.update(scheduling_snapshot(datetime.now().strftime('%Y%m%d%H%M')))
         
     except Exception as e:
         logger.error(f"Error getting system status: {e}")
@@ -216,9 +277,9 @@ def display_dashboard():
         """, unsafe_allow_html=True)
     else:
         # More detailed message about why AI is disabled
-        if not Config.OPENAI_API_KEY:
+        if not AI_STATE['has_key']:
             st.warning("🤖 **AI Intelligence Disabled** - OPENAI_API_KEY not found in configuration")
-        elif not Config.ENABLE_OPENAI_ENHANCEMENT:
+        elif not AI_STATE['flag_on']:
             st.warning("🤖 **AI Intelligence Disabled** - ENABLE_OPENAI_ENHANCEMENT is not set to true")
         else:
             st.warning("🤖 **AI Intelligence Disabled** - WorkflowManager not properly initialized with OpenAI")
@@ -243,7 +304,11 @@ def display_dashboard():
             test_system_components()
     
     with col4:
-        if st.button("🔄 Refresh Dashboard", width="stretch"):
+        if st.button("🔄 Refresh Dashboard", width="stretch", help="Re-run the connectivity checks and reload hours and leave data"):
+            probe_connections.clear()
+            cached_real_alerts.clear()
+            cached_week_statistics.clear()
+            get_workflow_manager().clear_caches()
             st.rerun()
     
     # Work Week Summary
@@ -267,37 +332,35 @@ def display_dashboard():
 
 def preview_alerts():
     """Preview who would receive alerts with AI analysis"""
-    workflow = st.session_state.workflow_manager
+    import pandas as pd  # imported here so dashboard reruns that never preview skip it
+    workflow = get_workflow_manager()
     
     try:
         # Get employees needing alerts
-        employees_needing_alerts = workflow.get_employees_needing_real_alerts()
+        work_week_start, work_week_end = workflow._get_monitoring_period()
+        employees_needing_alerts = cached_real_alerts(work_week_start.isoformat(), work_week_end.isoformat())
         
         if not employees_needing_alerts:
             st.success("✅ No employees need alerts for the previous work week!")
-            work_week_start, work_week_end = workflow._get_monitoring_period()
             st.info(f"All employees met their hour requirements for {work_week_start.strftime('%Y-%m-%d')} to {work_week_end.strftime('%Y-%m-%d')}")
         else:
             st.warning(f"⚠️ {len(employees_needing_alerts)} employees would receive alerts:")
             
-            # Create DataFrame for display
-            alert_data = []
-            for item in employees_needing_alerts:
-                employee = item['employee']
-                weekly_data = item['weekly_data']
-                
-                alert_data.append({
-                    'Name': employee['name'],
-                    'Email': employee['email'],
-                    'Hours Worked': f"{weekly_data['total_hours']:.2f}h",
-                    'Required Hours': f"{item['required_hours']:.1f}h",
-                    'Acceptable Hours': f"{item['acceptable_hours']:.1f}h",
-                    'Shortfall': f"{item['shortfall']:.2f}h",
-                    'Leave Days': Config.format_leave_days(item['leave_days']),
-                    'Working Days': item['working_days']
-                })
-            
-            df = pd.DataFrame(alert_data)
+            # Create DataFrame for display, one column at a time
+            df = pd.DataFrame({
+                'Name': [item['employee']['name'] for item in employees_needing_alerts],
+                'Email': [item['employee']['email'] for item in employees_needing_alerts],
+                'Hours Worked': [item['weekly_data']['total_hours'] for item in employees_needing_alerts],
+                'Required Hours': [item['required_hours'] for item in employees_needing_alerts],
+                'Acceptable Hours': [item['acceptable_hours'] for item in employees_needing_alerts],
+                'Shortfall': [item['shortfall'] for item in employees_needing_alerts],
+                'Leave Days': [Config.format_leave_days(item['leave_days']) for item in employees_needing_alerts],
+                'Working Days': [item['working_days'] for item in employees_needing_alerts]
+            })
+            # Format whole columns at once rather than per row
+            for column, fmt in (('Hours Worked', '{:.2f}h'), ('Required Hours', '{:.1f}h'),
+                                ('Acceptable Hours', '{:.1f}h'), ('Shortfall', '{:.2f}h')):
+                df[column] = df[column].map(fmt.format)
             st.dataframe(df, width="stretch", hide_index=True)
             
             # Download button
@@ -314,13 +377,19 @@ def preview_alerts():
 
 def generate_work_week_report():
     """Generate and display work week statistics"""
-    workflow = st.session_state.workflow_manager
+    # plotly is heavy and only needed for this report
+    import pandas as pd
+    import plotly.express as px
+    workflow = get_workflow_manager()
     
     try:
         with st.spinner("Generating work week report..."):
-            stats = workflow.get_work_week_statistics()
+            work_week_start, work_week_end = workflow._get_monitoring_period()
+            stats = cached_week_statistics(work_week_start.isoformat(), work_week_end.isoformat())
             
             if not stats:
+                # Don't keep serving a failed fetch for the next five minutes
+                cached_week_statistics.clear()
                 st.error("Failed to generate statistics")
                 return
             
@@ -417,7 +486,7 @@ def test_system_components():
             st.write(f"- OPENAI_API_KEY present: {'✅' if Config.OPENAI_API_KEY else '❌'}")
             st.write(f"- ENABLE_OPENAI_ENHANCEMENT: {'✅' if Config.ENABLE_OPENAI_ENHANCEMENT else '❌'}")
             
-            workflow = st.session_state.workflow_manager
+            workflow = get_workflow_manager()
             st.write("\n**WorkflowManager Check:**")
             st.write(f"- Has openai_client attribute: {'✅' if hasattr(workflow, 'openai_client') else '❌'}")
             st.write(f"- openai_client is configured: {'✅' if (hasattr(workflow, 'openai_client') and workflow.openai_client is not None) else '❌'}")
@@ -451,7 +520,7 @@ def display_work_week_summary():
     st.subheader("📈 Current Work Week Overview")
     
     try:
-        workflow = st.session_state.workflow_manager
+        workflow = get_workflow_manager()
         start, end = workflow.get_week_boundaries()
         
         st.info(f"Monitoring Period: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')} (Previous Week)")
@@ -527,6 +596,9 @@ def display_configuration_summary():
         st.error(f"Error displaying configuration: {str(e)}")
         logger.error(f"Configuration display error: {e}", exc_info=True)
 
+# AI status shared by the sidebar and the dashboard
+AI_STATE = get_ai_state()
+
 # Sidebar navigation
 with st.sidebar:
     st.markdown("🤖 **AI-Enhanced Employee Hours Monitor**")
@@ -552,8 +624,7 @@ with st.sidebar:
     st.markdown("---")
     
     # AI Status
-    workflow = st.session_state.workflow_manager
-    if hasattr(workflow, 'openai_client') and workflow.openai_client:
+    if AI_STATE['has_client']:
         st.success("🤖 **AI Intelligence Active**")
         st.write("- Smart decision making")
         st.write("- Confidence scoring")
@@ -561,9 +632,9 @@ with st.sidebar:
         st.write("- Personalized messages")
     else:
         st.warning("🤖 **AI Intelligence Inactive**")
-        if not Config.OPENAI_API_KEY:
+        if not AI_STATE['has_key']:
             st.write("- Missing OPENAI_API_KEY")
-        elif not Config.ENABLE_OPENAI_ENHANCEMENT:
+        elif not AI_STATE['flag_on']:
             st.write("- ENABLE_OPENAI_ENHANCEMENT not true")
         else:
             st.write("- WorkflowManager init issue")